@@ -8,7 +8,7 @@ __version__ = "2.0.0"
 from .logging_handler import setup_logging, QtLogHandler
 from .settings_manager import SettingsManager
 from .secure_storage import SecureStorage
-from .api_client import ApiClient, ApiWorker
+from .api_client import ApiClient, ApiWorker, ApiRunnable
 from .plugin_base import PluginBase
 from .plugin_registry import PluginRegistry
 from .event_bus import EventBus
@@ -21,6 +21,7 @@ __all__ = [
     'SecureStorage',
     'ApiClient',
     'ApiWorker',
+    'ApiRunnable',
     'PluginBase',
     'PluginRegistry',
     'EventBus',
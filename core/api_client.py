@@ -3,16 +3,30 @@ Reusable HTTP client with retry logic, timeout handling, and session management.
 Refactored from ApiWorker in arr_omnitool.py (line 121)
 """
 
+import json
 import logging
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from typing import Optional, Dict, Any, Callable
 
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# orjson decodes large, dict-heavy payloads (e.g. Jellyfin library listings)
+# several times faster than the stdlib; it is optional. Request bodies are
+# encoded to UTF-8 bytes either way.
+_json_loads = orjson.loads if orjson else json.loads
+_json_dumps = orjson.dumps if orjson else (lambda obj: json.dumps(obj).encode("utf-8"))
+
+HTTP_POOL_SIZE = 16  # Keep-alive connections kept per host
+
 
 class ApiClient:
     """
@@ -37,7 +51,14 @@ class ApiClient:
             backoff_factor=0.3,
             status_forcelist=(500, 502, 503, 504),
         )
-        adapter = HTTPAdapter(max_retries=retry)  # Fixed: was max_ri_retries
+        # Pool sized for the plugins' parallel workers (e.g. bulk deletes), so
+        # concurrent requests keep their keep-alive connections instead of
+        # dropping them when the default pool of 10 overflows.
+        adapter = HTTPAdapter(
+            max_retries=retry,  # Fixed: was max_ri_retries
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         return session
@@ -48,7 +69,7 @@ class ApiClient:
                      service_name: str = "",
                      params: Optional[Dict[str, Any]] = None,
                      method: str = "GET",
-                     json_payload: Optional[Dict[str, Any]] = None,
+                     json_payload: Optional[Any] = None,
                      timeout: Optional[int] = None) -> Any:
         """
         Generalized API request helper.
@@ -60,7 +81,7 @@ class ApiClient:
             service_name: Service type ('jellyfin' uses different auth header)
             params: Query parameters
             method: HTTP method (GET, POST, PUT, DELETE)
-            json_payload: JSON body for POST/PUT requests
+            json_payload: JSON body (dict or list) for POST/PUT requests
             timeout: Custom timeout (overrides default)
             
         Returns:
@@ -78,6 +99,7 @@ class ApiClient:
                 headers["X-Api-Key"] = api_key
         
         request_timeout = timeout if timeout is not None else self.timeout
+        body = _json_dumps(json_payload) if json_payload is not None else None
         
         try:
             if method.upper() == "GET":
@@ -86,11 +108,11 @@ class ApiClient:
             elif method.upper() == "POST":
                 logger.debug(f"POST {url} json={json_payload}")
                 headers["Content-Type"] = "application/json"
-                response = self.session.post(url, headers=headers, params=params, json=json_payload, timeout=request_timeout)
+                response = self.session.post(url, headers=headers, params=params, data=body, timeout=request_timeout)
             elif method.upper() == "PUT":
                 logger.debug(f"PUT {url} json={json_payload}")
                 headers["Content-Type"] = "application/json"
-                response = self.session.put(url, headers=headers, params=params, json=json_payload, timeout=request_timeout)
+                response = self.session.put(url, headers=headers, params=params, data=body, timeout=request_timeout)
             elif method.upper() == "DELETE":
                 logger.debug(f"DELETE {url}")
                 response = self.session.delete(url, headers=headers, params=params, timeout=request_timeout)
@@ -105,7 +127,7 @@ class ApiClient:
             if not response.content:
                 return {"status": "success"}
 
-            return response.json()
+            return _json_loads(response.content)
             
         except requests.exceptions.HTTPError as err:
             logger.error(f"API Request Failed for {method} {url}: {err}")
@@ -168,3 +190,17 @@ class ApiWorker(QObject):
                 self.finished.emit(None, str(e))
         finally:
             self.progress.emit(f"Task finished: {task_name}")
+
+
+class ApiRunnable(QRunnable):
+    """
+    Runs an ApiWorker on a QThreadPool thread instead of a dedicated QThread.
+    Connect to `runnable.worker`'s signals before starting it; the worker
+    lives in the creating thread, so its slots are invoked there.
+    """
+    def __init__(self, task_callable: Callable, *args, **kwargs):
+        super().__init__()
+        self.worker = ApiWorker(task_callable, *args, **kwargs)
+
+    def run(self):
+        self.worker.run()
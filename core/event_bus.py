@@ -28,6 +28,7 @@ class EventBus(QObject):
     # --- NEWLY ADDED EVENTS (Fixes "unknown event" warnings) ---
     add_to_arr_requested = pyqtSignal(str, str, str) # service_name, search_term, search_type
     request_all_status = pyqtSignal()                # Broadcast signal asking all plugins for status
+    jellyfin_items_updated = pyqtSignal(str, object) # item_type, items list (passed by reference, not copied)
     # --- END NEW EVENTS ---
     
     # Generic event for custom use
@@ -5,6 +5,7 @@ Defines the plugin interface and lifecycle.
 
 import logging
 from abc import ABC, abstractmethod
+from typing import Optional
 from PyQt6.QtWidgets import QWidget
 from .settings_manager import SettingsManager
 from .secure_storage import SecureStorage
@@ -17,6 +18,10 @@ class PluginBase(ABC):
     Abstract base class that all plugins must inherit from.
     Defines the standard interface for plugins in the system.
     """
+    # Subclasses may declare __slots__ too (for their own attributes) to drop
+    # the per-instance __dict__; those that don't keep working unchanged.
+    __slots__ = ("logger", "settings", "secure_storage", "api_client", "event_bus",
+                 "_enabled_cache", "_enabled_cache_subscribed")
     
     def __init__(self, logger: logging.Logger, settings: SettingsManager, secure_storage: SecureStorage, api_client: ApiClient, event_bus: EventBus):
         """
@@ -34,6 +39,8 @@ class PluginBase(ABC):
         self.secure_storage = secure_storage
         self.api_client = api_client
         self.event_bus = event_bus
+        self._enabled_cache: Optional[bool] = None  # See _is_enabled_cached()
+        self._enabled_cache_subscribed = False
 
     # --- Required Methods ---
     
@@ -176,4 +183,30 @@ class PluginBase(ABC):
             value: Value to store
         """
         plugin_name = self.get_name().lower().replace(" ", "_")
-        self.settings.set_plugin_setting(plugin_name, key, value)
\ No newline at end of file
+        self.settings.set_plugin_setting(plugin_name, key, value)
+
+    def _is_enabled_cached(self, plugin: str, cred_key: str, require_enabled_flag: bool = False) -> bool:
+        """
+        Memoized "URL and API key are configured" check for is_enabled().
+        Avoids a keyring lookup per call; cleared on the 'settings_changed' event.
+        
+        Args:
+            plugin: Settings namespace holding the 'url' (and 'enabled') keys
+            cred_key: SecureStorage key of the API key
+            require_enabled_flag: Also require the plugin's 'enabled' setting
+        """
+        if self._enabled_cache is None:
+            if not self._enabled_cache_subscribed:
+                self.event_bus.subscribe("settings_changed", self._clear_enabled_cache)
+                self._enabled_cache_subscribed = True
+            
+            url = self.settings.get_plugin_setting(plugin, "url", "")
+            api_key = self.secure_storage.get_credential(cred_key)
+            enabled = bool(url and api_key)
+            if require_enabled_flag:
+                enabled = enabled and bool(self.settings.get_plugin_setting(plugin, "enabled", False))
+            self._enabled_cache = enabled
+        return self._enabled_cache
+
+    def _clear_enabled_cache(self, plugin_name: str = "all"):
+        self._enabled_cache = None
\ No newline at end of file
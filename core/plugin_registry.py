@@ -80,7 +80,8 @@ class PluginRegistry:
         for name, obj in inspect.getmembers(module):
             if (inspect.isclass(obj) and 
                 issubclass(obj, PluginBase) and 
-                obj is not PluginBase):
+                obj is not PluginBase and
+                not inspect.isabstract(obj)):  # Skip shared bases like ArrPluginBase
                 plugin_classes.append((name, obj))
         
         if not plugin_classes:
@@ -5,6 +5,7 @@ Provides a central service for storing and retrieving sensitive data.
 """
 
 import logging
+from typing import Dict, Optional
 try:
     import keyring
 except ImportError:
@@ -16,12 +17,19 @@ logger = logging.getLogger(__name__)
 # Use a single, consistent service name for the application
 KEYRING_SERVICE_NAME = "ARROmniTool"
 
+_NOT_CACHED = object()
+
 class SecureStorage:
     """A wrapper for the keyring library."""
 
     def __init__(self):
-        if not keyring:
+        # Decided once; callers check this plain attribute before keyring work
+        self.is_available = keyring is not None
+        if not self.is_available:
             logger.critical("Keyring library is not installed. Secure storage is DISABLED.")
+        # Keyring backends are slow IPC calls (Secret Service, Keychain...), so each
+        # lookup's result, including "not found" (None), is kept until it is changed here
+        self._cache: Dict[str, Optional[str]] = {}
         
     def set_credential(self, key: str, password: str):
         """
@@ -35,8 +43,10 @@ class SecureStorage:
             return
         try:
             keyring.set_password(KEYRING_SERVICE_NAME, key, password)
+            self._cache[key] = password
             logger.info(f"Securely stored credential for: {key}")
         except Exception as e:
+            self._cache.pop(key, None)  # Vault state unknown; look it up again next time
             logger.error(f"Failed to store credential for {key}: {e}", exc_info=True)
 
     def get_credential(self, key: str) -> str | None:
@@ -50,10 +60,14 @@ class SecureStorage:
         """
         if not keyring:
             return None
+        password = self._cache.get(key, _NOT_CACHED)  # Single dict ops are safe from worker threads
+        if password is not _NOT_CACHED:
+            return password
         try:
             password = keyring.get_password(KEYRING_SERVICE_NAME, key)
             if password:
                 logger.debug(f"Retrieved credential for: {key}")
+            self._cache[key] = password
             return password
         except Exception as e:
             logger.error(f"Failed to retrieve credential for {key}: {e}", exc_info=True)
@@ -70,8 +84,10 @@ class SecureStorage:
             return
         try:
             keyring.delete_password(KEYRING_SERVICE_NAME, key)
+            self._cache[key] = None
             logger.info(f"Deleted credential for: {key}")
         except keyring.errors.PasswordDeleteError:
+            self._cache[key] = None
             logger.warning(f"No credential found to delete for: {key}")
         except Exception as e:
             logger.error(f"Failed to delete credential for {key}: {e}", exc_info=True)
\ No newline at end of file
@@ -5,12 +5,14 @@ Based on QSettings from arr_omnitool.py (line 2152)
 """
 
 from PyQt6.QtCore import QSettings
-from typing import Any
+from typing import Any, Dict
 
 # Application constants
 APP_NAME = "ARROmniTool"
 APP_ORGANIZATION = "volunteer"
 
+_UNSET = object()  # Cached marker for a global key that has no stored value
+
 
 class SettingsManager:
     """
@@ -19,6 +21,8 @@ class SettingsManager:
     """
     def __init__(self):
         self.qsettings = QSettings(APP_ORGANIZATION, APP_NAME)
+        # Raw global values already read from QSettings; written keys are dropped
+        self._global_cache: Dict[str, Any] = {}
 
     def get_plugin_setting(self, plugin_name: str, key: str, default: Any = None) -> Any:
         """
@@ -50,7 +54,12 @@ class SettingsManager:
         """
         # --- THIS IS THE FIX ---
         # Removed the 'type=setting_type' argument.
-        value = self.qsettings.value(key, default)
+        value = self._global_cache.get(key, _UNSET)
+        if value is _UNSET:
+            value = self.qsettings.value(key) if self.qsettings.contains(key) else _UNSET
+            self._global_cache[key] = value
+        if value is _UNSET:
+            value = default
         # --- END FIX ---
         
         # Handle case where QSettings returns string for bool
@@ -64,6 +73,7 @@ class SettingsManager:
         Sets a global (application-level) setting.
         """
         self.qsettings.setValue(key, value)
+        self._global_cache.pop(key, None)  # Re-read, so it comes back as QSettings stores it
         
     def get_qsettings(self) -> QSettings:
         """
@@ -83,4 +93,5 @@ class SettingsManager:
         """
         self.qsettings.beginGroup(plugin_name)
         self.qsettings.remove("")  # Remove all keys in this group
-        self.qsettings.endGroup()
\ No newline at end of file
+        self.qsettings.endGroup()
+        self._global_cache.clear()
\ No newline at end of file
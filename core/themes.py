@@ -26,13 +26,13 @@ QTabBar::tab:selected {
     background-color: #1e1e1e;
     border-bottom-color: #007acc;
 }
-QTableWidget {
+QTableView {
     background-color: #252526;
     alternate-background-color: #2d2d30;
     gridline-color: #3c3c3c;
     color: #d4d4d4;
 }
-QTableWidget::item:selected {
+QTableView::item:selected {
     background-color: #094771;
 }
 QHeaderView::section {
@@ -5,9 +5,10 @@ Shared utility functions used across the application.
 
 import re
 import csv
+import hashlib
 import logging
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Sequence, Union
 from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
@@ -137,36 +138,63 @@ def format_duration(seconds: int) -> str:
     
     return f"{hours}h {remaining_minutes}m"
 
+# Separators and whitespace runs tidied up after blacklist removal
+_SCRUB_SEPARATORS_RE = re.compile(r'[\.\[\]\(\)\-_{}]')
+_SCRUB_WHITESPACE_RE = re.compile(r'\s+')
+
+def compile_blacklist(blacklist: list[str]) -> list[re.Pattern]:
+    """
+    Compiles blacklist regex strings (case-insensitive) for repeated scrub_name calls.
+    Invalid patterns are logged and skipped.
+    """
+    patterns = []
+    for pattern_string in blacklist:
+        try:
+            patterns.append(re.compile(pattern_string, re.IGNORECASE))
+        except re.error as e:
+            logger.warning(f"Invalid regex in blacklist, skipping: '{pattern_string}'. Error: {e}")
+    return patterns
+
+def blacklist_digest(raw_list: str) -> str:
+    """Fingerprint of a saved blacklist text, stored next to its parsed form to detect edits."""
+    return hashlib.sha1(raw_list.encode("utf-8")).hexdigest()
+
 # --- MODIFIED FUNCTION ---
-def scrub_name(name: str, blacklist: list[str]) -> str:
+def scrub_name(name: str, blacklist: Sequence[Union[str, re.Pattern]]) -> str:
     """
     Removes blacklist regex patterns from a name and cleans up common separators.
+    Patterns may be given as strings or pre-compiled (see compile_blacklist).
     """
     scrubbed_name = name
     
     # 1. Remove all blacklist patterns (case-insensitive)
-    for pattern_string in blacklist:
+    for pattern in blacklist:
         # This is the active part of the "enable/disable" feature.
         # We process the list given to us (which is pre-filtered).
-        try:
-            pattern = re.compile(pattern_string, re.IGNORECASE)
-            scrubbed_name = pattern.sub("", scrubbed_name)
-        except re.error as e:
-            logger.warning(f"Invalid regex in blacklist, skipping: '{pattern_string}'. Error: {e}")
-            pass
+        if isinstance(pattern, str):
+            try:
+                pattern = re.compile(pattern, re.IGNORECASE)
+            except re.error as e:
+                logger.warning(f"Invalid regex in blacklist, skipping: '{pattern}'. Error: {e}")
+                continue
+        scrubbed_name = pattern.sub("", scrubbed_name)
 
     # 2. Clean up common separators and artifacts left behind
     # Replace common delimiters with a space
-    scrubbed_name = re.sub(r'[\.\[\]\(\)\-_{}]', ' ', scrubbed_name)
+    scrubbed_name = _SCRUB_SEPARATORS_RE.sub(' ', scrubbed_name)
     
     # 3. Consolidate multiple spaces into one
-    scrubbed_name = re.sub(r'\s+', ' ', scrubbed_name).strip()
+    scrubbed_name = _SCRUB_WHITESPACE_RE.sub(' ', scrubbed_name).strip()
     
     # 4. Remove leading/trailing spaces or hyphens one last time
     scrubbed_name = scrubbed_name.strip(" -")
     
     return scrubbed_name
 
+def scrub_names(names: Sequence[str], blacklist: Sequence[Union[str, re.Pattern]]) -> list[str]:
+    """scrub_name over many names; safe to run off the GUI thread with compiled patterns."""
+    return [scrub_name(name, blacklist) for name in names]
+
 def parse_csv_to_list(file_path: str) -> list[str]:
     """Reads the first column of a CSV into a list of strings."""
     words = []
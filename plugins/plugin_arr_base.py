@@ -3,20 +3,23 @@
 Base *Arr Plugin
 Contains the shared ArrTab logic for Sonarr, Radarr, and Lidarr.
 This class is designed to be subclassed and have its task
-methods overridden.
+methods overridden. ArrPluginBase is the matching plugin wrapper.
 """
 import logging
 import csv
 import json
 from typing import Optional, List, Dict, Any
 
+import requests
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QComboBox, QHBoxLayout,
     QPushButton, QLineEdit, QTableWidget, QTableWidgetItem,
     QMessageBox, QFileDialog, QGridLayout, QTextEdit
 )
-from PyQt6.QtCore import Qt, QThread, QTimer
-from core.api_client import ApiClient, ApiWorker
+from PyQt6.QtCore import Qt, QThread, QThreadPool, QTimer
+from core.api_client import ApiClient, ApiRunnable
+from core.plugin_base import PluginBase
 from core.settings_manager import SettingsManager
 from core.secure_storage import SecureStorage
 from core.event_bus import EventBus
@@ -24,6 +27,13 @@ from ui.dialogs import SelectionDialog
 
 logger = logging.getLogger(__name__)
 
+ADD_BATCH_SIZE = 50  # Queued adds are flushed in one bulk POST at this size, or when searching is done
+
+# Each *arr tab runs its tasks on a pool of its own, so idle threads are recycled
+# instead of parking QThreads, and shutdown waits only on that tab's work; a couple
+# of cores are left to the GUI. Qt's global pool (dialogs, Settings tests) is left alone.
+ARR_POOL_THREADS = max(2, QThread.idealThreadCount() - 2)
+
 class ArrTab(QWidget):
     """
     Shared base tab for *Arr services.
@@ -39,20 +49,17 @@ class ArrTab(QWidget):
         self.event_bus = event_bus
         
         # --- Internal State ---
-        self.status_thread = None
-        self.status_worker = None
-        self.folders_thread = None
-        self.folders_worker = None
-        self.profiles_thread = None
-        self.profiles_worker = None
-        self.search_thread = None
-        self.search_worker = None
+        self._tasks: Dict[str, Any] = {}  # Task key -> running ApiWorker ("status", "folders", "profiles", "search", "add")
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(ARR_POOL_THREADS)
+        self._search_seq = 0  # Bumped per search; results from older searches are dropped
         
         self.terms_to_add_queue = []
         self.items_to_add_queue = []
         self.terms_to_add_total_count = 0
         self.current_search_term = None
         self.current_search_type = "item"
+        self._arr_creds_cache = None  # (base_url, api_key), cleared on "settings_changed"
         
         # --- Build UI ---
         self._build_ui()
@@ -60,6 +67,7 @@ class ArrTab(QWidget):
         # --- Event Bus Subscription ---
         self.event_bus.subscribe("add_to_arr_requested", self._on_add_request)
         self.event_bus.subscribe("request_all_status", self.check_status)
+        self.event_bus.subscribe("settings_changed", self._on_settings_changed)
 
         # --- Initial Load ---
         QTimer.singleShot(500, self.check_status)
@@ -81,6 +89,11 @@ class ArrTab(QWidget):
         """API endpoint for adding an item"""
         return "movie" # Radarr default
 
+    @property
+    def item_import_endpoint(self) -> str:
+        """API endpoint for adding a list of items in one request"""
+        return f"{self.item_add_endpoint}/import"
+
     # --- UI Setup ---
 
     def _build_ui(self):
@@ -153,12 +166,20 @@ class ArrTab(QWidget):
     # --- Base URL Helper ---
 
     def _get_arr_base_url(self) -> (str, str):
-        """Helper to get base URL and API key for this service."""
+        """Helper to get base URL and API key for this service. Memoized until settings change."""
+        if self._arr_creds_cache is not None:
+            return self._arr_creds_cache
         base_url = self.settings.get_plugin_setting(self.service_name, "url")
         api_key = self.secure_storage.get_credential(f"{self.service_name}_api_key")
         if not base_url or not api_key:
             raise ValueError(f"{self.service_name} URL or API Key is not set in settings.")
-        return base_url.rstrip("/"), api_key
+        self._arr_creds_cache = (base_url.rstrip("/"), api_key)
+        return self._arr_creds_cache
+
+    def _on_settings_changed(self, plugin_name: str):
+        """Drops the memoized credentials so the next task re-reads them."""
+        if plugin_name in ("all", self.service_name):
+            self._arr_creds_cache = None
 
     # --- Worker Task Functions (Designed to be Overridden) ---
 
@@ -250,15 +271,19 @@ class ArrTab(QWidget):
     def _build_add_payload(self, item_json: Dict[str, Any], item_data: Dict[str, Any]) -> Dict[str, Any]:
         """Builds the JSON payload for adding an item. Designed to be overridden."""
         # Default (Radarr)
-        return {
+        payload = {
             "tmdbId": item_json.get("tmdbId"),
             "title": item_json.get("title"),
             "qualityProfileId": item_data["quality_profile_id"],
             "rootFolderPath": item_data["root_folder_path"],
             "monitored": True,
-            "addOptions": { "searchForMovie": True },
-            **{k: item_json[k] for k in ["titleSlug", "images", "year"] if k in item_json}
+            "addOptions": { "searchForMovie": True }
         }
+        for key in ("titleSlug", "images", "year"):
+            value = item_json.get(key)
+            if value is not None:
+                payload[key] = value
+        return payload
 
     def _task_add_item(self, item_data: Dict[str, Any]) -> Dict[str, Any]:
         """Worker task to add an *Arr item."""
@@ -274,42 +299,68 @@ class ArrTab(QWidget):
             endpoint, api_key, self.service_name, method="POST", json_payload=payload
         )
 
+    def _task_add_items(self, items_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Worker task to add several *Arr items with one POST to the import endpoint.
+        Falls back to one POST per item if the batch is rejected (e.g. one item already exists).
+        """
+        if len(items_data) > 1:
+            base_url, api_key = self._get_arr_base_url()
+            try:
+                payloads = [self._build_add_payload(d["item_json"], d) for d in items_data]
+                endpoint = f"{base_url}/api/{self.api_version}/{self.item_import_endpoint}"
+                response = self.api_client.api_request(
+                    endpoint, api_key, self.service_name, method="POST", json_payload=payloads
+                )
+                added = response if isinstance(response, list) else payloads
+                return {"added": added, "errors": []}
+            except (requests.exceptions.HTTPError, ValueError) as e:
+                self.logger.warning(f"Bulk add of {len(items_data)} items was rejected, adding one at a time: {e}")
+        
+        added, errors = [], []
+        for item_data in items_data:
+            try:
+                added.append(self._task_add_item(item_data))
+            except Exception as e:
+                errors.append(str(e))
+        return {"added": added, "errors": errors}
+
     # --- Core Class Methods (Status, Folders, Profiles) ---
     
-    def _start_worker(self, thread_attr: str, worker_attr: str, task_function: callable, on_finished_slot: callable, **task_kwargs):
+    def _start_worker(self, task_key: str, task_function: callable, on_finished_slot: callable, **task_kwargs):
         """
-        Generic helper to create, connect, and start a worker thread.
+        Generic helper to run a task on this tab's thread pool.
+        Only one task per key runs at a time.
         """
-        if getattr(self, thread_attr) is not None:
-            self.logger.warning(f"Task for {thread_attr} is already running.")
+        if task_key in self._tasks:
+            self.logger.warning(f"Task for {task_key} is already running.")
             return
 
-        thread = QThread()
-        worker = ApiWorker(task_function, **task_kwargs)
-        
-        setattr(self, thread_attr, thread)
-        setattr(self, worker_attr, worker)
-
-        worker.moveToThread(thread)
+        runnable = ApiRunnable(task_function, **task_kwargs)
+        worker = runnable.worker
+        self._tasks[task_key] = worker
 
+        # Free the key first, so the slot can start the next task under it
+        # (unless the task was superseded and the key already reused)
+        worker.finished.connect(lambda *_: self._tasks.pop(task_key, None) if self._tasks.get(task_key) is worker else None)
         worker.finished.connect(on_finished_slot)
-        worker.finished.connect(thread.quit)
-        worker.finished.connect(worker.deleteLater)
+        worker.progress.connect(self.logger.info)
         
-        thread.finished.connect(lambda: setattr(self, thread_attr, None))
-        thread.finished.connect(lambda: setattr(self, worker_attr, None))
-        thread.finished.connect(thread.deleteLater)
+        self._thread_pool.start(runnable)
 
-        worker.progress.connect(self.logger.info)
-        thread.started.connect(worker.run)
-        thread.start()
+    def stop_all_tasks(self, timeout_ms: int = 2000):
+        """Tells running workers not to report back, then waits for this tab's pool to drain."""
+        for worker in self._tasks.values():
+            worker.stop()
+        self._tasks.clear()
+        self._thread_pool.waitForDone(timeout_ms)
 
     def check_status(self):
         self.btn_check_status.setEnabled(False)
         self.status_label.setText("Checking...")
         
         self._start_worker(
-            "status_thread", "status_worker",
+            "status",
             self._task_get_status,
             self.on_status_finished
         )
@@ -332,7 +383,7 @@ class ArrTab(QWidget):
     def refresh_root_folders(self):
         self.btn_refresh_folders.setEnabled(False)
         self._start_worker(
-            "folders_thread", "folders_worker",
+            "folders",
             self._task_get_root_folders,
             self.on_root_folders_finished
         )
@@ -352,7 +403,7 @@ class ArrTab(QWidget):
     def refresh_quality_profiles(self):
         self.btn_refresh_profiles.setEnabled(False)
         self._start_worker(
-            "profiles_thread", "profiles_worker",
+            "profiles",
             self._task_get_quality_profiles,
             self.on_quality_profiles_finished
         )
@@ -379,6 +430,7 @@ class ArrTab(QWidget):
         self.terms_to_add_queue = [search_term]
         self.terms_to_add_total_count = 1
         self.search_input.clear()
+        self._cancel_search()
         self.process_next_item_in_queue()
     
     def import_from_csv(self):
@@ -401,6 +453,7 @@ class ArrTab(QWidget):
                 self.terms_to_add_queue = terms
                 self.terms_to_add_total_count = len(terms)
                 self.logger.info(f"Loaded {len(terms)} terms from CSV. Starting batch add...")
+                self._cancel_search()
                 self.process_next_item_in_queue()
                 
         except Exception as e:
@@ -421,20 +474,22 @@ class ArrTab(QWidget):
             QMessageBox.warning(self, "No Quality Profile", "Please select a quality profile first.")
             return False
         
+        # Picks already queued from an earlier run are kept; they were confirmed and
+        # go out with the next bulk add
         self.terms_to_add_queue = []
-        self.items_to_add_queue = []
         return True
 
     def process_next_item_in_queue(self):
-        if self.search_thread is not None:
+        if "search" in self._tasks or "add" in self._tasks:
             self.logger.warning("Search/add queue is already processing.")
             return
         
-        if self.items_to_add_queue:
-            item_data = self.items_to_add_queue.pop(0)
-            title = item_data.get("item_json", {}).get("title", item_data.get("item_json", {}).get("artistName", "Unknown"))
-            self.logger.info(f"Processing ADD for: '{title}'")
-            self._run_add_worker(item_data)
+        # Searches run first so their picks accumulate into one bulk add
+        if self.items_to_add_queue and (not self.terms_to_add_queue or len(self.items_to_add_queue) >= ADD_BATCH_SIZE):
+            items_data = self.items_to_add_queue
+            self.items_to_add_queue = []
+            self.logger.info(f"Processing ADD for {len(items_data)} item(s)")
+            self._run_add_worker(items_data)
         
         elif self.terms_to_add_queue:
             self.current_search_term = self.terms_to_add_queue.pop(0)
@@ -449,20 +504,35 @@ class ArrTab(QWidget):
             return
  
     def _run_search_worker(self, term: str):
+        self._search_seq += 1
+        seq = self._search_seq
         self._start_worker(
-            "search_thread", "search_worker",
+            "search",
             self._task_search_item,
-            self.on_search_finished,
+            lambda result, error: self._on_search_result(seq, result, error),
             term=term,
             search_type=self.current_search_type
         )
+
+    def _on_search_result(self, seq: int, result: Optional[List[Dict[str, Any]]], error: str):
+        if seq != self._search_seq:
+            self.logger.info("Dropping result of a superseded search.")
+            return
+        self.on_search_finished(result, error)
+
+    def _cancel_search(self):
+        """Supersedes an in-flight search (not an add); its result is dropped when it lands."""
+        worker = self._tasks.pop("search", None)
+        if worker is not None:
+            worker.stop()
+            self._search_seq += 1
  
-    def _run_add_worker(self, item_data: Dict[str, Any]):
+    def _run_add_worker(self, items_data: List[Dict[str, Any]]):
         self._start_worker(
-            "search_thread", "search_worker",
-            self._task_add_item,
+            "add",
+            self._task_add_items,
             self.on_add_finished,
-            item_data=item_data
+            items_data=items_data
         )
  
     def on_search_finished(self, result: Optional[List[Dict[str, Any]]], error: str):
@@ -509,16 +579,21 @@ class ArrTab(QWidget):
         self.logger.info(f"Queued item for adding: '{title}'")
  
     def on_add_finished(self, result: Optional[Dict[str, Any]], error: str):
-        if error or result is None:
-            if "400" in error and ("already" in error.lower() or "exist" in error.lower()):
+        errors = [error] if (error or result is None) else result["errors"]
+        failed = []
+        for add_error in errors:
+            if "400" in add_error and ("already" in add_error.lower() or "exist" in add_error.lower()):
                 self.logger.warning(f"Item already exists in {self.service_name}. Skipping.")
             else:
-                self.logger.error(f"Failed to add item: {error}")
-                QMessageBox.critical(self, "Add Error", f"Failed to add item:\n{error}")
-        else:
-            title = result.get('title', result.get('artistName', "Unknown Item"))
+                self.logger.error(f"Failed to add item: {add_error}")
+                failed.append(add_error)
+        if failed:
+            QMessageBox.critical(self, "Add Error", "Failed to add item:\n" + "\n".join(failed[:10]))
+        
+        for added in (result or {}).get("added", []):
+            title = added.get('title', added.get('artistName', "Unknown Item"))
             self.logger.info(f"Successfully added '{title}'.")
-            self.event_bus.publish("item_added", self.service_name, result)
+            self.event_bus.publish("item_added", self.service_name, added)
  
         self.process_next_item_in_queue()
  
@@ -532,4 +607,46 @@ class ArrTab(QWidget):
         
         self.terms_to_add_queue = [search_term]
         self.terms_to_add_total_count = 1
-        self.process_next_item_in_queue()
\ No newline at end of file
+        self._cancel_search()
+        self.process_next_item_in_queue()
+
+
+class ArrPluginBase(PluginBase):
+    """
+    Shared plugin wrapper for ArrTab-based services.
+    Subclasses set SERVICE_NAME and TAB_NAME (and TAB_CLASS for a customised tab),
+    plus the remaining PluginBase methods (version, description, icon).
+    """
+    __slots__ = ("widget",)
+    TAB_CLASS = ArrTab
+    SERVICE_NAME = ""
+    TAB_NAME = ""
+
+    def __init__(self, logger: logging.Logger, settings: SettingsManager, secure_storage: SecureStorage, api_client: ApiClient, event_bus: EventBus):
+        super().__init__(logger, settings, secure_storage, api_client, event_bus)
+        self.widget = None
+
+    def get_name(self) -> str:
+        return self.SERVICE_NAME
+
+    def get_widget(self) -> QWidget:
+        # The main window calls this on every tab change; build the tab once
+        if self.widget is not None:
+            return self.widget
+        self.widget = self.TAB_CLASS(
+            service_name=self.SERVICE_NAME,
+            logger=self.logger,
+            settings=self.settings,
+            secure_storage=self.secure_storage,
+            api_client=self.api_client,
+            event_bus=self.event_bus
+        )
+        return self.widget
+
+    def get_tab_name(self) -> str:
+        return self.TAB_NAME
+
+    def cleanup(self):
+        """Stop any running tasks on shutdown."""
+        if self.widget:
+            self.widget.stop_all_tasks()
@@ -57,6 +57,4 @@ class BazarrPlugin(PluginBase):
         return "💬"
     
     def is_enabled(self) -> bool:
-        url = self.settings.get_plugin_setting("bazarr", "url", "")
-        api_key = self.secure_storage.get_credential("bazarr_api_key")
-        return bool(url and api_key)
\ No newline at end of file
+        return self._is_enabled_cached("bazarr", "bazarr_api_key")
\ No newline at end of file
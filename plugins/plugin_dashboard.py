@@ -47,7 +47,9 @@ class DashboardPlugin(PluginBase):
         return "Overview dashboard showing status of all media services"
     
     def get_widget(self) -> QWidget:
-        """Create the dashboard widget."""
+        """Create the dashboard widget (once; later calls return the same one)."""
+        if self.widget is not None:
+            return self.widget
         self.widget = QWidget()
         layout = QVBoxLayout(self.widget)
         
@@ -10,29 +10,74 @@ import logging
 import csv
 import re
 import os
+import gzip
+import json
+import hashlib
+import shutil
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, List, Dict, Any
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+
+import requests
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QComboBox, QHBoxLayout,
-    QPushButton, QLineEdit, QTableWidget, QTableWidgetItem,
+    QPushButton, QLineEdit, QTableView,
     QMessageBox, QFileDialog, QMenu, QHeaderView, QCheckBox, QDialog,
     QFormLayout, QDialogButtonBox, QSplitter, QTextEdit
 )
-from PyQt6.QtCore import Qt, QThread, QTimer, QPoint, pyqtSignal
+from PyQt6.QtCore import (
+    Qt, QThread, QThreadPool, QTimer, QPoint, QStandardPaths, pyqtSignal,
+    QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+)
 from PyQt6.QtGui import QBrush, QColor
 from core.plugin_base import PluginBase
-from core.api_client import ApiClient, ApiWorker
+from core.api_client import ApiClient, ApiWorker, ApiRunnable
 from core.settings_manager import SettingsManager
 from core.event_bus import EventBus
 from core.secure_storage import SecureStorage # Import new core service
-from core.utils import scrub_name # Import from core
+from core.utils import scrub_name, scrub_names, compile_blacklist, blacklist_digest # Import from core
+from ui.dialogs import ResultsModel, REMOTE_SEARCH_COLUMNS, REMOTE_SEARCH_COLUMN_WIDTHS, make_results_table
 
 # --- Application Configuration ---
 CACHE_DURATION_SECONDS = 300  # 5 minutes for Jellyfin cache
+STALE_CACHE_MAX_AGE_SECONDS = 7 * 24 * 3600  # Expired disk caches younger than this are shown while refreshing
+DEFAULT_DELETE_CONCURRENCY = 8  # Parallel DELETE requests; override with 'jellyfin/delete_concurrency'
+BULK_DELETE_CHUNK_SIZE = 200  # Ids per DELETE /Items call, keeps the query string short
+APPLY_CONCURRENCY = 4  # Parallel RemoteSearch/Apply calls per queued batch
+FILTER_DEBOUNCE_MS = 150  # Delay after the last keystroke before the table is filtered
+MAX_PENDING_DELETE_FAILURES = 1000  # Oldest unresolved delete requests are forgotten beyond this
+
+# The only item fields the tab, dialogs and CSV export use. Everything else
+# Jellyfin returns (image tags, blurhashes, user data...) is dropped on ingest.
+ITEM_FIELDS = ("Id", "Name", "Type", "ProductionYear", "Path", "ProviderIds")
 
 logger = logging.getLogger(__name__)
 
+# Item data roles resolved once; JellyfinItemModel.data() runs for every visible cell
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_USER_ROLE = Qt.ItemDataRole.UserRole
+_BACKGROUND_ROLE = Qt.ItemDataRole.BackgroundRole
+
+# Used to normalise names when grouping duplicates
+_SCRUB_PUNCT_TABLE = str.maketrans({c: ' ' for c in '.[]()-_{}'})
+_SCRUB_WS_RE = re.compile(r'\s+')
+
+def _csv_export_rows(items: List[Dict[str, Any]]):
+    """Yields one CSV row per item, for csv.writer.writerows."""
+    for item in items:
+        provider_ids = item.get("ProviderIds") or {}
+        yield (
+            item.get("Name", ""),
+            item.get("ProductionYear", ""),
+            item.get("Path", ""),
+            provider_ids.get("Tmdb", ""),
+            provider_ids.get("Tvdb", ""),
+            provider_ids.get("Imdb", ""),
+        )
+
 #
 # --- DIALOG: DeleteConfirmationDialog (v2.2.0) ---
 #
@@ -115,7 +160,10 @@ class BlacklistWidget(QWidget):
         layout.addWidget(QLabel("<b>Blacklist</b> (one entry per line, '#' to comment)"))
         
         self.blacklist_edit = QTextEdit()
+        self.blacklist_edit.textChanged.connect(self._on_blacklist_edited)
         layout.addWidget(self.blacklist_edit)
+        self._cached_words: Optional[list[str]] = None  # Parsed active words, reset on edit
+        self._cached_patterns: Optional[list[re.Pattern]] = None  # Compiled words, reset on edit
         
         button_layout = QHBoxLayout()
         self.btn_save_settings = QPushButton("Save List")
@@ -132,24 +180,37 @@ class BlacklistWidget(QWidget):
 
     def _load_blacklist_from_settings(self):
         raw_list = self.settings.get_global_setting("identify_blacklist", "")
-        self.blacklist_edit.setText(raw_list)
+        self.blacklist_edit.setPlainText(raw_list)  # Never parsed as HTML, unlike setText()
+        # Reuse the list parsed at save time while the saved text is unchanged
+        if self.settings.get_global_setting("identify_blacklist_hash", "") == blacklist_digest(raw_list):
+            try:
+                self._cached_words = json.loads(self.settings.get_global_setting("identify_blacklist_parsed", ""))
+            except ValueError:
+                pass
 
     def _save_blacklist_to_settings(self):
         raw_list = self.blacklist_edit.toPlainText()
         self.settings.set_global_setting("identify_blacklist", raw_list)
+        self.settings.set_global_setting("identify_blacklist_hash", blacklist_digest(raw_list))
+        self.settings.set_global_setting("identify_blacklist_parsed", json.dumps(self.get_blacklist_words()))
         QMessageBox.information(self, "Blacklist Saved", "Your blacklist has been saved to settings.")
         
     def get_blacklist_words(self) -> list[str]:
-        raw_list = self.blacklist_edit.toPlainText()
-        words = raw_list.split('\n')
-        
-        active_words = []
-        for w in words:
-            w_stripped = w.strip()
-            if w_stripped and not w_stripped.startswith("#"):
-                active_words.append(w_stripped)
-        
-        return active_words
+        """Active (non-commented) words, parsed once per edit of the text."""
+        if self._cached_words is None:
+            stripped = (w.strip() for w in self.blacklist_edit.toPlainText().split('\n'))
+            self._cached_words = [w for w in stripped if w and not w.startswith("#")]
+        return self._cached_words
+
+    def get_blacklist_patterns(self) -> list[re.Pattern]:
+        """The active words compiled for scrub_name, built once per edit of the text."""
+        if self._cached_patterns is None:
+            self._cached_patterns = compile_blacklist(self.get_blacklist_words())
+        return self._cached_patterns
+
+    def _on_blacklist_edited(self):
+        self._cached_words = None
+        self._cached_patterns = None
 
 #
 # --- DIALOG: IdentifyDialog (from dialogs.py) ---
@@ -166,14 +227,14 @@ class IdentifyDialog(QDialog):
         self.api_client = api_client
         self.settings = settings
         self.secure_storage = secure_storage # <-- Added
+        self._credentials = None  # (base_url, api_key), see _get_api_credentials
         
         self.item_id = item_id
         self.item_type = item_type
         self.search_results = []
         self.selected_result = None
         
-        self.api_thread = None
-        self.api_worker = None
+        self.api_worker = None  # Worker of the search in flight, if any
         self.is_initial_search = True
         
         main_layout = QHBoxLayout(self)
@@ -199,13 +260,11 @@ class IdentifyDialog(QDialog):
         
         layout.addLayout(form_layout)
         
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["Title", "Year", "Provider", "Overview"])
-        self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        self.table.itemDoubleClicked.connect(self.on_ok)
+        self.model = ResultsModel(REMOTE_SEARCH_COLUMNS, self)
+        self.table = make_results_table(
+            self.model, QTableView.SelectionMode.SingleSelection, REMOTE_SEARCH_COLUMN_WIDTHS
+        )
+        self.table.doubleClicked.connect(self.on_ok)
         layout.addWidget(self.table)
         
         self.buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
@@ -214,7 +273,7 @@ class IdentifyDialog(QDialog):
         self.buttons.button(QDialogButtonBox.StandardButton.Ok).setEnabled(False)
         layout.addWidget(self.buttons)
         
-        self.table.itemSelectionChanged.connect(
+        self.table.selectionModel().selectionChanged.connect(
             lambda: self.buttons.button(QDialogButtonBox.StandardButton.Ok).setEnabled(True)
         )
         
@@ -226,13 +285,15 @@ class IdentifyDialog(QDialog):
         splitter.setSizes([600, 300])
         main_layout.addWidget(splitter)
         
-        QTimer.singleShot(100, self.start_search)
+        QTimer.singleShot(0, self.start_search)
 
     def _get_api_credentials(self):
-        """Helper to get credentials securely."""
-        base_url = self.settings.get_plugin_setting("jellyfin", "url")
-        api_key = self.secure_storage.get_credential("jellyfin_api_key")
-        return base_url, api_key
+        """Helper to get credentials securely; read once per dialog, on the first search."""
+        if self._credentials is None:
+            base_url = self.settings.get_plugin_setting("jellyfin", "url")
+            api_key = self.secure_storage.get_credential("jellyfin_api_key")
+            self._credentials = (base_url, api_key)
+        return self._credentials
 
     def _task_remote_search(self, item_type: str, search_payload: Dict[str, Any]):
         base_url, api_key = self._get_api_credentials()
@@ -249,60 +310,40 @@ class IdentifyDialog(QDialog):
     def start_search(self):
         # ... (This method remains the same, it calls _task_remote_search) ...
         # ... (No, wait, it needs to be updated to not pass credentials) ...
-        if self.api_thread is not None:
-            if self.api_worker: self.api_worker.stop()
-            self.api_thread.quit()
-            self.api_thread.wait(1000)
+        self._cancel_search()
 
         self.btn_search.setEnabled(False)
         self.btn_search.setText("Searching...")
-        self.table.clearContents()
-        self.table.setRowCount(0)
+        self.model.set_rows([])
         
         search_name = self.name_input.text().strip()
         search_year = self.year_input.text().strip()
         
         if self.is_initial_search:
             self.is_initial_search = False
-            blacklist = self.blacklist_widget.get_blacklist_words()
+            blacklist = self.blacklist_widget.get_blacklist_patterns()
             scrubbed_name = scrub_name(search_name, blacklist)
             
             if scrubbed_name != search_name:
                 self.name_input.setText(scrubbed_name)
                 search_name = scrubbed_name
         
+        search_info = {"Name": search_name}
+        if search_year.isdigit() and int(search_year):
+            search_info["Year"] = int(search_year)
         search_payload = {
-            "SearchInfo": {
-                "Name": search_name,
-                "Year": int(search_year) if search_year.isdigit() else None
-            },
+            "SearchInfo": search_info,
             "ItemId": self.item_id,
             "IncludeDisabledProviders": False
         }
         
-        if not search_payload["SearchInfo"]["Year"]:
-             del search_payload["SearchInfo"]["Year"]
-        
-        self.api_thread = QThread()
-        self.api_worker = ApiWorker(
-            self._task_remote_search,
-            item_type=self.item_type,
-            search_payload=search_payload
-        )
-        self.api_worker.moveToThread(self.api_thread)
-        
-        self.api_thread.started.connect(self.api_worker.run)
-        self.api_worker.finished.connect(self.on_search_finished)
-        
-        self.api_thread.start()
+        self._run_search(self.item_type, search_payload)
 
     def on_search_finished(self, result: Optional[List[Dict[str, Any]]], error: str):
         # ... (This method remains exactly the same) ...
-        if self.api_thread:
-            self.api_thread.quit()
-            self.api_thread.wait(1000)
-            self.api_thread = None
-            self.api_worker = None
+        if self.sender() is not self.api_worker:
+            return  # Late result from a search that was superseded
+        self.api_worker = None
         
         self.btn_search.setEnabled(True)
         self.btn_search.setText("Search")
@@ -313,17 +354,7 @@ class IdentifyDialog(QDialog):
             return
             
         self.search_results = result
-        self.table.setRowCount(len(self.search_results))
-        
-        for i, item in enumerate(self.search_results):
-            self.table.setItem(i, 0, QTableWidgetItem(item.get("Name", "N/A")))
-            self.table.setItem(i, 1, QTableWidgetItem(str(item.get("ProductionYear", "N/A"))))
-            provider_ids = item.get("ProviderIds", {})
-            provider_str = ", ".join(f"{k}: {v}" for k, v in provider_ids.items() if v)
-            self.table.setItem(i, 2, QTableWidgetItem(provider_str))
-            self.table.setItem(i, 3, QTableWidgetItem(item.get("Overview", "")[:100] + "..."))
-            
-        self.table.resizeColumnsToContents()
+        self.model.set_rows(result)
 
     def on_ok(self):
         # ... (This method remains exactly the same) ...
@@ -341,12 +372,26 @@ class IdentifyDialog(QDialog):
         
     def closeEvent(self, event):
         # ... (This method remains exactly the same) ...
-        if self.api_thread is not None:
-            if self.api_worker: self.api_worker.stop()
-            self.api_thread.quit()
-            self.api_thread.wait(1000)
+        self._cancel_search()
         event.accept()
 
+    def _run_search(self, item_type: str, search_payload: Dict[str, Any]):
+        """Runs one remote search on the shared thread pool."""
+        runnable = ApiRunnable(
+            self._task_remote_search,
+            item_type=item_type,
+            search_payload=search_payload
+        )
+        self.api_worker = runnable.worker
+        self.api_worker.finished.connect(self.on_search_finished)
+        QThreadPool.globalInstance().start(runnable)
+
+    def _cancel_search(self):
+        """Drops the result of the search in flight (the HTTP call itself finishes in the background)."""
+        if self.api_worker is not None:
+            self.api_worker.stop()
+            self.api_worker = None
+
 #
 # --- DIALOG: BulkIdentifyDialog (from dialogs.py) ---
 #
@@ -364,14 +409,15 @@ class BulkIdentifyDialog(QDialog):
         self.api_client = api_client
         self.settings = settings
         self.secure_storage = secure_storage # <-- Added
+        self._credentials = None  # (base_url, api_key), see _get_api_credentials
         
         self.items_list = items_list
         self.current_item_index = -1
         self.current_item_data = None
         self.search_results = []
+        self._scrubbed_names: Dict[int, str] = {}  # Item index -> scrubbed search name
         
-        self.api_thread = None
-        self.api_worker = None
+        self.api_worker = None  # Worker of the search in flight, if any
         
         main_layout = QHBoxLayout(self)
         splitter = QSplitter(Qt.Orientation.Horizontal)
@@ -401,15 +447,13 @@ class BulkIdentifyDialog(QDialog):
         
         layout.addLayout(form_layout)
         
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["Title", "Year", "Provider", "Overview"])
-        self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        self.model = ResultsModel(REMOTE_SEARCH_COLUMNS, self)
+        self.table = make_results_table(
+            self.model, QTableView.SelectionMode.SingleSelection, REMOTE_SEARCH_COLUMN_WIDTHS
+        )
         layout.addWidget(self.table)
         
-        self.table.itemDoubleClicked.connect(self.on_apply_next)
+        self.table.doubleClicked.connect(self.on_apply_next)
         
         button_layout = QHBoxLayout()
         self.btn_apply_next = QPushButton("Apply & Next")
@@ -426,19 +470,21 @@ class BulkIdentifyDialog(QDialog):
         button_layout.addWidget(self.btn_cancel)
         layout.addLayout(button_layout)
         
-        self.table.itemSelectionChanged.connect(
+        self.table.selectionModel().selectionChanged.connect(
             lambda: self.btn_apply_next.setEnabled(True)
         )
         
         splitter.addWidget(left_widget)
         
         self.blacklist_widget = BlacklistWidget(self.settings)
+        self.blacklist_widget.blacklist_edit.textChanged.connect(self._scrubbed_names.clear)
         splitter.addWidget(self.blacklist_widget)
 
         splitter.setSizes([600, 300])
         main_layout.addWidget(splitter)
         
-        QTimer.singleShot(100, self.load_next_item)
+        QTimer.singleShot(0, self._prescrub_names)
+        QTimer.singleShot(0, self.load_next_item)
 
     def load_next_item(self):
         # ... (This method remains the same) ...
@@ -456,8 +502,10 @@ class BulkIdentifyDialog(QDialog):
         item_path = self.current_item_data.get("Path", "N/A")
         item_year = str(self.current_item_data.get("ProductionYear", ""))
 
-        blacklist = self.blacklist_widget.get_blacklist_words()
-        scrubbed_name = scrub_name(item_name, blacklist)
+        scrubbed_name = self._scrubbed_names.get(self.current_item_index)
+        if scrubbed_name is None:
+            blacklist = self.blacklist_widget.get_blacklist_patterns()
+            scrubbed_name = scrub_name(item_name, blacklist)
 
         self.item_label.setText(item_name)
         self.path_label.setText(f"<b>Path:</b> {item_path}")
@@ -468,11 +516,28 @@ class BulkIdentifyDialog(QDialog):
         
         self.start_search(is_auto_search=True)
 
+    def _prescrub_names(self):
+        """Scrubs every item's name on the thread pool once the dialog is up, so moving on to the next item doesn't."""
+        blacklist = self.blacklist_widget.get_blacklist_patterns()
+        names = [item.get("Name") or "" for item in self.items_list]
+        runnable = ApiRunnable(scrub_names, names, blacklist)
+        runnable.worker.finished.connect(
+            lambda result, error: self._on_names_prescrubbed(result, blacklist)
+        )
+        QThreadPool.globalInstance().start(runnable)
+
+    def _on_names_prescrubbed(self, result: Optional[List[str]], blacklist: List[re.Pattern]):
+        # A blacklist edit while scrubbing replaces the compiled list; drop the stale names then
+        if result is not None and blacklist is self.blacklist_widget.get_blacklist_patterns():
+            self._scrubbed_names.update(enumerate(result))
+
     def _get_api_credentials(self):
-        """Helper to get credentials securely."""
-        base_url = self.settings.get_plugin_setting("jellyfin", "url")
-        api_key = self.secure_storage.get_credential("jellyfin_api_key")
-        return base_url, api_key
+        """Helper to get credentials securely; read once per dialog, on the first search."""
+        if self._credentials is None:
+            base_url = self.settings.get_plugin_setting("jellyfin", "url")
+            api_key = self.secure_storage.get_credential("jellyfin_api_key")
+            self._credentials = (base_url, api_key)
+        return self._credentials
 
     def _task_remote_search(self, item_type: str, search_payload: Dict[str, Any]):
         base_url, api_key = self._get_api_credentials()
@@ -491,15 +556,11 @@ class BulkIdentifyDialog(QDialog):
         if not self.current_item_data:
             return
 
-        if self.api_thread is not None:
-            if self.api_worker: self.api_worker.stop()
-            self.api_thread.quit()
-            self.api_thread.wait(1000)
+        self._cancel_search()
         
         self.btn_search.setEnabled(False)
         self.btn_search.setText("Searching...")
-        self.table.clearContents()
-        self.table.setRowCount(0)
+        self.model.set_rows([])
         
         search_name = self.name_input.text().strip()
         search_year = self.year_input.text().strip()
@@ -507,43 +568,28 @@ class BulkIdentifyDialog(QDialog):
         item_type = self.current_item_data.get("Type")
 
         if not is_auto_search:
-            blacklist = self.blacklist_widget.get_blacklist_words()
+            blacklist = self.blacklist_widget.get_blacklist_patterns()
             scrubbed_name = scrub_name(search_name, blacklist)
-            self.name_input.setText(scrubbed_name)
-            search_name = scrubbed_name
+            if scrubbed_name != search_name:
+                self.name_input.setText(scrubbed_name)
+                search_name = scrubbed_name
 
+        search_info = {"Name": search_name}
+        if search_year.isdigit() and int(search_year):
+            search_info["Year"] = int(search_year)
         search_payload = {
-            "SearchInfo": {
-                "Name": search_name,
-                "Year": int(search_year) if search_year.isdigit() else None
-            },
+            "SearchInfo": search_info,
             "ItemId": item_id,
             "IncludeDisabledProviders": False
         }
         
-        if not search_payload["SearchInfo"]["Year"]:
-             del search_payload["SearchInfo"]["Year"]
-        
-        self.api_thread = QThread()
-        self.api_worker = ApiWorker(
-            self._task_remote_search,
-            item_type=item_type,
-            search_payload=search_payload
-        )
-        self.api_worker.moveToThread(self.api_thread)
-        
-        self.api_thread.started.connect(self.api_worker.run)
-        self.api_worker.finished.connect(self.on_search_finished)
-        
-        self.api_thread.start()
+        self._run_search(item_type, search_payload)
 
     def on_search_finished(self, result: Optional[List[Dict[str, Any]]], error: str):
         # ... (This method remains the same) ...
-        if self.api_thread:
-            self.api_thread.quit()
-            self.api_thread.wait(1000)
-            self.api_thread = None
-            self.api_worker = None
+        if self.sender() is not self.api_worker:
+            return  # Late result from a search that was superseded
+        self.api_worker = None
         
         self.btn_search.setEnabled(True)
         self.btn_search.setText("Search")
@@ -554,17 +600,7 @@ class BulkIdentifyDialog(QDialog):
             return
             
         self.search_results = result
-        self.table.setRowCount(len(self.search_results))
-        
-        for i, item in enumerate(self.search_results):
-            self.table.setItem(i, 0, QTableWidgetItem(item.get("Name", "N/A")))
-            self.table.setItem(i, 1, QTableWidgetItem(str(item.get("ProductionYear", "N/A"))))
-            provider_ids = item.get("ProviderIds", {})
-            provider_str = ", ".join(f"{k}: {v}" for k, v in provider_ids.items() if v)
-            self.table.setItem(i, 2, QTableWidgetItem(provider_str))
-            self.table.setItem(i, 3, QTableWidgetItem(item.get("Overview", "")[:100] + "..."))
-            
-        self.table.resizeColumnsToContents()
+        self.model.set_rows(result)
 
     def on_apply_next(self):
         # ... (This method remains the same) ...
@@ -585,12 +621,161 @@ class BulkIdentifyDialog(QDialog):
 
     def closeEvent(self, event):
         # ... (This method remains the same) ...
-        if self.api_thread is not None:
-            if self.api_worker: self.api_worker.stop()
-            self.api_thread.quit()
-            self.api_thread.wait(1000)
+        self._cancel_search()
         event.accept()
 
+    def _run_search(self, item_type: str, search_payload: Dict[str, Any]):
+        """Runs one remote search on the shared thread pool."""
+        runnable = ApiRunnable(
+            self._task_remote_search,
+            item_type=item_type,
+            search_payload=search_payload
+        )
+        self.api_worker = runnable.worker
+        self.api_worker.finished.connect(self.on_search_finished)
+        QThreadPool.globalInstance().start(runnable)
+
+    def _cancel_search(self):
+        """Drops the result of the search in flight (the HTTP call itself finishes in the background)."""
+        if self.api_worker is not None:
+            self.api_worker.stop()
+            self.api_worker = None
+
+#
+# --- MODEL: JellyfinItemModel ---
+#
+class JellyfinItemModel(QAbstractTableModel):
+    """
+    Read-only table model over the Jellyfin item dicts.
+    Cells are produced on demand in data() instead of one QTableWidgetItem per cell,
+    and sorting reorders a list of row indices in Python rather than comparing cells.
+    """
+    COLUMNS = ("Title", "Year", "Path")
+    SORT_KEYS = (
+        None,  # Title sorts on names_lower
+        lambda item: item.get("ProductionYear") or 0,
+        lambda item: item.get("Path") or "",
+    )
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._items: List[Dict[str, Any]] = []
+        # Lower-cased item names, parallel to the items; kept here rather than in the
+        # item dicts, which are cached to disk and shared with other plugins
+        self.names_lower: List[str] = []
+        self._order: List[int] = []  # View row -> index into self._items
+        self._backgrounds: Dict[int, QBrush] = {}  # Item index -> brush, only for highlighted rows
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+
+    def set_items(self, items: List[Dict[str, Any]]):
+        """Swaps in a new item list with a single model reset, keeping the current sort."""
+        self.beginResetModel()
+        self._items = items
+        self.names_lower = [(item.get("Name") or "").lower() for item in items]
+        self._order = self._sorted_order()
+        self._backgrounds = {}
+        self.endResetModel()
+
+    def set_row_backgrounds(self, backgrounds: Dict[int, QBrush]):
+        """Replaces the highlighted items; items not in the dict use the default background."""
+        if not backgrounds and not self._backgrounds:
+            return
+        self._backgrounds = backgrounds
+        if self._items:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self._items) - 1, len(self.COLUMNS) - 1),
+                [_BACKGROUND_ROLE]
+            )
+
+    def _sorted_order(self) -> List[int]:
+        if self._sort_column < 0:
+            return list(range(len(self._items)))
+        key = self.SORT_KEYS[self._sort_column]
+        items = self._items
+        return sorted(
+            range(len(items)),
+            key=self.names_lower.__getitem__ if key is None else (lambda i: key(items[i])),
+            reverse=self._sort_order == Qt.SortOrder.DescendingOrder
+        )
+
+    def sort(self, column: int, order=Qt.SortOrder.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        self._sort_column = column
+        self._sort_order = order
+        old_order = self._order
+        self._order = self._sorted_order()
+        
+        # Keep selections and other persistent indexes on the same items
+        new_row_of = {item_index: row for row, item_index in enumerate(self._order)}
+        old_indexes = self.persistentIndexList()
+        new_indexes = [
+            self.index(new_row_of[old_order[index.row()]], index.column())
+            for index in old_indexes
+        ]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+
+    def item_index(self, row: int) -> int:
+        """Index into the item list for a source row."""
+        return self._order[row]
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._order)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index: QModelIndex, role=_DISPLAY_ROLE):
+        if not index.isValid():
+            return None
+        item_index = self._order[index.row()]
+        if role == _DISPLAY_ROLE:
+            item = self._items[item_index]
+            column = index.column()
+            if column == 0:
+                return item.get("Name", "N/A")
+            if column == 1:
+                return str(item.get("ProductionYear", "N/A"))
+            return item.get("Path", "N/A")
+        if role == _USER_ROLE:
+            return item_index  # Index into self.items, whatever the sort
+        if role == _BACKGROUND_ROLE:
+            return self._backgrounds.get(item_index)
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
+class JellyfinFilterProxyModel(QSortFilterProxyModel):
+    """
+    Filters JellyfinItemModel rows by title, and optionally to a set of item
+    indices (the duplicate view). Sorting is left to the source model.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFilterKeyColumn(0)
+        self.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self._allowed_items: Optional[set] = None
+
+    def set_allowed_items(self, allowed_items: Optional[set]):
+        """Restricts the view to these item indices (None shows all) with one refilter."""
+        self._allowed_items = allowed_items
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if self._allowed_items is not None and self.sourceModel().item_index(source_row) not in self._allowed_items:
+            return False
+        return super().filterAcceptsRow(source_row, source_parent)
+
+    def sort(self, column: int, order=Qt.SortOrder.AscendingOrder):
+        # The source sorts with a Python key function, far cheaper than the
+        # proxy calling back into data() for every comparison.
+        self.sourceModel().sort(column, order)
+
 # 
 # --- MAIN CLASS: JellyfinTab ---
 #
@@ -607,8 +792,13 @@ class JellyfinTab(QWidget):
         self.api_client = api_client
         self.event_bus = event_bus
         
-        self.item_cache = []
-        self.last_fetch_time = None
+        self.item_cache: Dict[str, tuple] = {}  # item_type -> (time.monotonic() of fetch, items)
+        self.listing_item_type = None  # item_type of the fetch in flight
+        self.disk_cache_dir = os.path.join(
+            QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation),
+            "jellyfin"
+        )
+        self._cached_user_id = None  # (base_url, user_id) of the admin user
         
         self.list_thread = None
         self.list_worker = None
@@ -618,12 +808,20 @@ class JellyfinTab(QWidget):
         self.status_worker = None
         self.delete_thread = None
         self.delete_worker = None
+        self.export_thread = None
+        self.export_worker = None
+        self.stale_thread = None
+        self.stale_worker = None
+        self.list_pending = False  # True while a listing fetch is in flight
+        self.showing_stale = False  # True while the table holds an expired disk cache
         
         self.apply_queue = []
         self.apply_job_running = False
         
         self.showing_duplicates = False
         self.duplicate_groups = []
+        self._dup_blacklist_cache = ("", None)  # (blacklist text, compiled pattern)
+        self._dup_groups_cache = (None, "", [])  # (items list, blacklist text, groups)
         
         # --- Build UI ---
         # All UI building code remains the same
@@ -663,7 +861,12 @@ class JellyfinTab(QWidget):
         filter_layout.addWidget(QLabel("Filter List:"))
         self.filter_input = QLineEdit()
         self.filter_input.setPlaceholderText("Type here to filter results...")
-        self.filter_input.textChanged.connect(self.filter_table)
+        # Coalesce bursts of keystrokes into a single filter pass
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self.filter_timer.timeout.connect(self.filter_table)
+        self.filter_input.textChanged.connect(self.filter_timer.start)
         filter_layout.addWidget(self.filter_input)
         
         filter_layout.addWidget(QLabel("Dup Blacklist:"))
@@ -678,14 +881,23 @@ class JellyfinTab(QWidget):
         self.btn_add_missing.setVisible(False)
         layout.addWidget(self.btn_add_missing)
         
-        self.table = QTableWidget()
-        self.table.setColumnCount(3)
-        self.table.setHorizontalHeaderLabels(["Title", "Year", "Path"])
+        self.item_model = JellyfinItemModel(self)
+        self.proxy_model = JellyfinFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.item_model)
+        
+        # Shown while the table holds an expired disk cache rather than the server's listing
+        self.stale_label = QLabel()
+        self.stale_label.setStyleSheet("QLabel { color: #FFA500; }")
+        self.stale_label.setVisible(False)
+        layout.addWidget(self.stale_label)
+        
+        self.table = QTableView()
+        self.table.setModel(self.proxy_model)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self.show_context_menu)
-        self.table.setSelectionMode(QTableWidget.SelectionMode.ExtendedSelection)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QTableView.SelectionMode.ExtendedSelection)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.table.setSortingEnabled(True)
         
         layout.addWidget(self.table)
@@ -694,10 +906,16 @@ class JellyfinTab(QWidget):
         
         self.event_bus.subscribe("request_all_status", self.check_jellyfin_status)
         
+        # Credentials are memoized (keyring lookups are slow IPC) until settings change
+        self._cred_cache = None
+        self.event_bus.subscribe("settings_changed", self.on_settings_changed)
+        
         # --- Add new event subscription for filesystem ---
         # This makes the "broadcast on failure" more robust
         self.event_bus.subscribe("filesystem_delete_failure", self.on_filesystem_delete_failed)
-        self.pending_delete_failures = {} # To track failures
+        self.pending_delete_failures = OrderedDict() # To track failures, oldest first
+        # File deletes record failures from worker threads; the GUI thread reads them
+        self._delete_failures_lock = threading.Lock()
 
     # --- Worker Task Functions ---
     def _start_worker(self, thread_attr: str, worker_attr: str, task_function: callable, on_finished_slot: callable, **task_kwargs):
@@ -727,35 +945,121 @@ class JellyfinTab(QWidget):
         thread.start()
 
     def _get_api_credentials(self):
-        """Helper to get credentials securely."""
+        """Helper to get credentials securely. Memoized until the next 'settings_changed' event."""
+        if self._cred_cache is not None:
+            return self._cred_cache
         base_url = self.settings.get_plugin_setting("jellyfin", "url")
         api_key = self.secure_storage.get_credential("jellyfin_api_key")
         if not base_url or not api_key:
             raise ValueError("Jellyfin URL or API Key is not set/found in secure storage.")
-        return base_url, api_key
+        self._cred_cache = (base_url, api_key)
+        return self._cred_cache
 
-    def _task_get_items(self, item_type: str) -> List[Dict[str, Any]]:
-        base_url, api_key = self._get_api_credentials()
+    def on_settings_changed(self, plugin_name: str):
+        """Drops memoized credentials so the next task re-reads settings and secure storage."""
+        if plugin_name in ("all", "jellyfin"):
+            self._cred_cache = None
+
+    def _disk_cache_path(self, base_url: str, item_type: str) -> str:
+        """One cache file per server and item type, so switching servers never serves stale data."""
+        server_key = hashlib.sha1(base_url.rstrip("/").encode("utf-8")).hexdigest()[:12]
+        return os.path.join(self.disk_cache_dir, f"items_{server_key}_{item_type}.json.gz")
+
+    def _load_disk_cache(self, cache_path: str, max_age: float = CACHE_DURATION_SECONDS) -> Optional[List[Dict[str, Any]]]:
+        """Returns cached items if the file is younger than max_age seconds, else None."""
+        try:
+            age = time.time() - os.path.getmtime(cache_path)
+            if age >= max_age:
+                return None
+            with gzip.open(cache_path, "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable Jellyfin cache {cache_path}: {e}")
+            return None
+
+    def _save_disk_cache(self, cache_path: str, items: List[Dict[str, Any]]):
+        """Writes items atomically so a crash mid-write never leaves a truncated cache."""
+        tmp_path = f"{cache_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=1) as f:
+                json.dump(items, f, separators=(",", ":"))
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            self.logger.warning(f"Failed to write Jellyfin cache {cache_path}: {e}")
+
+    def _get_user_id(self, base_url: str, api_key: str) -> str:
+        """Returns the admin user's ID, only querying /Users the first time per server."""
+        if self._cached_user_id and self._cached_user_id[0] == base_url:
+            return self._cached_user_id[1]
         
         users = self.api_client.api_request(f"{base_url}/Users", api_key, service_name="jellyfin")
         if not users:
             raise ValueError("No users found on Jellyfin server.")
         
-        admin_user = next((u for u in users if u.get("Policy", {}).get("IsAdministrator")), None)
-        user_id = admin_user["Id"] if admin_user else users[0]["Id"]
+        admin_user = next((u for u in users if u.get("Policy", {}).get("IsAdministrator")), users[0])
+        self._cached_user_id = (base_url, admin_user["Id"])
+        return admin_user["Id"]
+
+    def _task_get_stale_items(self, item_type: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Loads an expired (but not ancient) disk cache to show while the listing
+        refreshes. Returns None when there is none, or when it is still fresh
+        (the listing task serves that itself).
+        """
+        base_url, _ = self._get_api_credentials()
+        cache_path = self._disk_cache_path(base_url, item_type)
+        try:
+            if time.time() - os.path.getmtime(cache_path) < CACHE_DURATION_SECONDS:
+                return None
+        except OSError:
+            return None
+        
+        return self._load_disk_cache(cache_path, max_age=STALE_CACHE_MAX_AGE_SECONDS)
+
+    def _task_get_items(self, item_type: str, force_refresh: bool = False) -> List[Dict[str, Any]]:
+        base_url, api_key = self._get_api_credentials()
+        
+        cache_path = self._disk_cache_path(base_url, item_type)
+        if not force_refresh:
+            cached_items = self._load_disk_cache(cache_path)
+            if cached_items is not None:
+                self.logger.info(f"Loaded {len(cached_items)} {item_type} items from disk cache.")
+                return cached_items
         
         params = {
             "IncludeItemTypes": item_type,
             "Recursive": "true",
             "Fields": "ProviderIds,Path",
+            "EnableImages": "false",
+            "EnableUserData": "false",
         }
         
-        response = self.api_client.api_request(
-            f"{base_url}/Users/{user_id}/Items",
-            api_key, service_name="jellyfin", params=params, timeout=120
-        )
-        items = response.get("Items", [])
+        user_id = self._get_user_id(base_url, api_key)
+        try:
+            response = self.api_client.api_request(
+                f"{base_url}/Users/{user_id}/Items",
+                api_key, service_name="jellyfin", params=params, timeout=120
+            )
+        except requests.exceptions.HTTPError as e:
+            if e.response is None or e.response.status_code not in (401, 404):
+                raise
+            # The cached user may have been removed; look it up again once.
+            self.logger.info("Jellyfin rejected the cached user, looking it up again.")
+            self._cached_user_id = None
+            user_id = self._get_user_id(base_url, api_key)
+            response = self.api_client.api_request(
+                f"{base_url}/Users/{user_id}/Items",
+                api_key, service_name="jellyfin", params=params, timeout=120
+            )
+        items = [
+            {field: item[field] for field in ITEM_FIELDS if field in item}
+            for item in response.get("Items", [])
+        ]
         self.logger.info(f"Found {len(items)} {item_type} items in Jellyfin.")
+        self._save_disk_cache(cache_path, items)
         return items
 
     def _task_apply_identification(self, item_id: str, search_result: Dict[str, Any]) -> Dict[str, Any]:
@@ -770,76 +1074,158 @@ class JellyfinTab(QWidget):
         )
         self.logger.info(f"Successfully applied new identification to item {item_id}.")
         return response
+
+    def _task_apply_identifications(self, jobs: List[tuple]) -> Dict[str, Any]:
+        """Applies a batch of (item_id, search_result) jobs, APPLY_CONCURRENCY at a time."""
+        applied = []
+        errors = []
+        with ThreadPoolExecutor(max_workers=min(APPLY_CONCURRENCY, len(jobs))) as executor:
+            futures = {
+                executor.submit(self._task_apply_identification, item_id, search_result): item_id
+                for item_id, search_result in jobs
+            }
+            for future in as_completed(futures):
+                item_id = futures[future]
+                try:
+                    future.result()
+                    applied.append(item_id)
+                except Exception as e:
+                    self.logger.error(f"Failed to apply identification to item {item_id}: {e}")
+                    errors.append(f"{item_id}: {e}")
+        return {"applied": applied, "errors": errors}
     
+    def _get_delete_concurrency(self) -> int:
+        """Number of parallel DELETE requests, from the 'jellyfin/delete_concurrency' setting."""
+        try:
+            value = int(self.settings.get_plugin_setting("jellyfin", "delete_concurrency", DEFAULT_DELETE_CONCURRENCY))
+        except (TypeError, ValueError):
+            value = DEFAULT_DELETE_CONCURRENCY
+        return max(1, value)
+
+    def _delete_media_path(self, file_path: str, item_id: str) -> Optional[str]:
+        """Deletes a media file or folder from disk. Returns an error message, or None on success."""
+        try:
+            # 1. Try native deletion. A single stat tells file from folder, and a
+            #    missing path surfaces as FileNotFoundError (no exists() pre-check).
+            if stat.S_ISDIR(os.stat(file_path).st_mode):
+                shutil.rmtree(file_path)
+                self.logger.info(f"Deleted directory (native): {file_path}")
+            else:
+                os.remove(file_path)
+                self.logger.info(f"Deleted file (native): {file_path}")
+            return None
+            
+        except FileNotFoundError:
+            self.logger.warning(f"File not found (may have been already deleted): {file_path}")
+            return f"File not found: {file_path}"
+        except Exception as e:
+            # 2. Native failed! Broadcast for help.
+            self.logger.warning(
+                f"Native file delete failed for {file_path}: {e}. "
+                "Broadcasting filesystem_delete_request event."
+            )
+            try:
+                # Store this path to check for a failure event later
+                self._track_delete_failure(file_path, item_id)
+                self.event_bus.publish("filesystem_delete_request", file_path)
+                # Optimistically count as deleted for now.
+                # on_filesystem_delete_failed will correct this if it fails.
+                return None
+            except Exception as pub_e:
+                self.logger.error(f"Failed to publish delete event: {pub_e}")
+                return f"Failed to publish delete event for {file_path}: {pub_e}"
+
+    def _delete_item(self, base_url: str, api_key: str, item_id: str, missing_ok: bool = False) -> Optional[str]:
+        """Deletes a single item from Jellyfin. Returns an error message, or None on success."""
+        try:
+            self.api_client.api_request(
+                f"{base_url}/Items/{item_id}", api_key, method="DELETE", service_name="jellyfin", timeout=30
+            )
+        except requests.exceptions.HTTPError as e:
+            # A partially applied bulk delete may already have removed it
+            if missing_ok and e.response is not None and e.response.status_code == 404:
+                return None
+            self.logger.error(f"Failed to delete item {item_id}: {e}")
+            return f"Item {item_id}: {str(e)}"
+        except Exception as e:
+            self.logger.error(f"Failed to delete item {item_id}: {e}")
+            return f"Item {item_id}: {str(e)}"
+        
+        self.logger.info(f"Successfully deleted item {item_id} from Jellyfin")
+        return None
+
+    def _bulk_delete_items(self, base_url: str, api_key: str, item_ids: List[str]) -> bool:
+        """Deletes a chunk of items with one DELETE /Items?ids=... call. Returns False if it was rejected."""
+        try:
+            self.api_client.api_request(
+                f"{base_url}/Items", api_key, method="DELETE", service_name="jellyfin",
+                params={"ids": ",".join(item_ids)}, timeout=120
+            )
+        except Exception as e:
+            self.logger.warning(f"Bulk delete of {len(item_ids)} items failed, retrying them one by one: {e}")
+            return False
+        
+        self.logger.info(f"Successfully deleted {len(item_ids)} items from Jellyfin (bulk)")
+        return True
+
     def _task_delete_items(self, item_ids: List[str], item_paths: Optional[List[str]] = None, delete_files: bool = False) -> Dict[str, Any]:
         base_url, api_key = self._get_api_credentials()
         
-        deleted_count = 0
         failed_count = 0
         errors = []
         files_deleted = 0
         files_failed = 0
         
         id_to_path = {}
-        if item_paths and len(item_paths) == len(item_ids):
+        if delete_files and item_paths and len(item_paths) == len(item_ids):
             id_to_path = dict(zip(item_ids, item_paths))
         
-        for item_id in item_ids:
-            endpoint = f"{base_url}/Items/{item_id}"
-            try:
-                # Delete from Jellyfin first
-                self.api_client.api_request(
-                    endpoint, api_key, method="DELETE", service_name="jellyfin", timeout=30
-                )
-                deleted_count += 1
-                self.logger.info(f"Successfully deleted item {item_id} from Jellyfin")
-                
-                # If delete_files is True, delete the actual file
-                if delete_files and item_id in id_to_path:
-                    file_path = id_to_path[item_id]
-                    try:
-                        if not os.path.exists(file_path):
-                            self.logger.warning(f"File not found (may have been already deleted): {file_path}")
-                            files_failed += 1
-                            errors.append(f"File not found: {file_path}")
-                            continue
-                            
-                        # 1. Try native deletion
-                        if os.path.isdir(file_path):
-                            import shutil
-                            shutil.rmtree(file_path)
-                            self.logger.info(f"Deleted directory (native): {file_path}")
-                        else:
-                            os.remove(file_path)
-                            self.logger.info(f"Deleted file (native): {file_path}")
+        # 1. Delete from Jellyfin in chunks, falling back to per-item
+        #    requests (in parallel) for any chunk the server rejects.
+        deleted_ids = []
+        retry_ids = []
+        for start in range(0, len(item_ids), BULK_DELETE_CHUNK_SIZE):
+            chunk = item_ids[start:start + BULK_DELETE_CHUNK_SIZE]
+            if self._bulk_delete_items(base_url, api_key, chunk):
+                deleted_ids.extend(chunk)
+            else:
+                retry_ids.extend(chunk)
+        
+        if retry_ids:
+            max_workers = min(self._get_delete_concurrency(), len(retry_ids))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self._delete_item, base_url, api_key, item_id, True): item_id
+                    for item_id in retry_ids
+                }
+                for future in as_completed(futures):
+                    error = future.result()
+                    if error:
+                        failed_count += 1
+                        errors.append(error)
+                    else:
+                        deleted_ids.append(futures[future])
+        
+        # 2. Remove media only for items Jellyfin confirmed as deleted. Media
+        #    folders on HDDs/NAS shares delete much faster side by side.
+        media_paths = [(item_id, id_to_path[item_id]) for item_id in deleted_ids if id_to_path.get(item_id)]
+        if media_paths:
+            max_workers = min(self._get_delete_concurrency(), len(media_paths))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(self._delete_media_path, file_path, item_id)
+                    for item_id, file_path in media_paths
+                ]
+                for future in as_completed(futures):
+                    file_error = future.result()
+                    if file_error:
+                        files_failed += 1
+                        errors.append(file_error)
+                    else:
                         files_deleted += 1
-                        
-                    except Exception as e:
-                        # 2. Native failed! Broadcast for help.
-                        self.logger.warning(
-                            f"Native file delete failed for {file_path}: {e}. "
-                            "Broadcasting filesystem_delete_request event."
-                        )
-                        try:
-                            # Store this path to check for a failure event later
-                            self.pending_delete_failures[file_path] = item_id
-                            self.event_bus.publish("filesystem_delete_request", file_path)
-                            # Optimistically count as deleted for now.
-                            # on_filesystem_delete_failed will correct this if it fails.
-                            files_deleted += 1
-                        except Exception as pub_e:
-                            self.logger.error(f"Failed to publish delete event: {pub_e}")
-                            files_failed += 1
-                            errors.append(f"Failed to publish delete event for {file_path}: {pub_e}")
-                        
-            except Exception as e:
-                failed_count += 1
-                error_msg = f"Item {item_id}: {str(e)}"
-                errors.append(error_msg)
-                self.logger.error(f"Failed to delete item {item_id}: {e}")
         
         return {
-            "deleted": deleted_count,
+            "deleted": len(deleted_ids),
             "failed": failed_count,
             "files_deleted": files_deleted,
             "files_failed": files_failed,
@@ -848,6 +1234,13 @@ class JellyfinTab(QWidget):
             "delete_files": delete_files
         }
 
+    def _task_export_csv(self, file_path: str, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+        with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(["Title", "Year", "Path", "TMDB ID", "TVDB ID", "IMDb ID"])
+            writer.writerows(_csv_export_rows(items))
+        return {"count": len(items), "file_path": file_path}
+
     def _task_get_status(self) -> Dict[str, Any]:
         base_url, api_key = self._get_api_credentials()
         
@@ -858,13 +1251,22 @@ class JellyfinTab(QWidget):
 
     # --- End of Worker Task Functions ---
 
+    def _track_delete_failure(self, file_path: str, item_id: str):
+        """Remembers a delegated file delete, evicting the oldest past MAX_PENDING_DELETE_FAILURES.
+        Called from the delete task's worker threads."""
+        with self._delete_failures_lock:
+            self.pending_delete_failures[file_path] = item_id
+            while len(self.pending_delete_failures) > MAX_PENDING_DELETE_FAILURES:
+                self.pending_delete_failures.popitem(last=False)
+
     # --- Event Handlers ---
     def on_filesystem_delete_failed(self, file_path: str, error_message: str):
         """
         Slot to receive delete failure events from the FileSystem plugin.
         """
-        if file_path in self.pending_delete_failures:
-            item_id = self.pending_delete_failures.pop(file_path, 'Unknown')
+        with self._delete_failures_lock:
+            item_id = self.pending_delete_failures.pop(file_path, None)
+        if item_id is not None:
             self.logger.error(f"Received filesystem_delete_failure for item {item_id} at {file_path}: {error_message}")
             # This is tricky as the job is already finished.
             # We can't update the results dialog, but we can log it.
@@ -893,13 +1295,14 @@ class JellyfinTab(QWidget):
         # ... (This method remains the same) ...
         item_type = self.type_combo.currentText()
         
+        cached = self.item_cache.get(item_type)
         if (not force_refresh and 
-            self.item_cache and 
-            self.last_fetch_time and 
-            (time.time() - self.last_fetch_time < CACHE_DURATION_SECONDS)):
+            cached and 
+            (time.monotonic() - cached[0] < CACHE_DURATION_SECONDS)):
             
-            self.logger.info(f"Loading {len(self.item_cache)} {item_type} items from cache.")
-            self.items = self.item_cache
+            self._set_stale_listing(None)
+            self.items = cached[1]
+            self.logger.info(f"Loading {len(self.items)} {item_type} items from cache.")
             self.populate_table(self.items)
             self.btn_export.setEnabled(True)
             self.btn_find_duplicates.setEnabled(True)
@@ -910,76 +1313,99 @@ class JellyfinTab(QWidget):
         self.btn_force_refresh.setEnabled(False)
         self.btn_find_duplicates.setEnabled(False)
         self.logger.info(f"Fetching {item_type} items from Jellyfin...")
+        self.listing_item_type = item_type
+        self.list_pending = True
         
         try:
             self._start_worker(
                 "list_thread", "list_worker",
                 self._task_get_items,
                 self.on_list_finished,
-                item_type=item_type
+                item_type=item_type,
+                force_refresh=force_refresh
             )
+            # Stale-while-revalidate: show an expired disk copy until the fetch lands.
+            # Skipped on forced refreshes, which follow deletes/applies the copy predates.
+            if not force_refresh:
+                self._start_worker(
+                    "stale_thread", "stale_worker",
+                    self._task_get_stale_items,
+                    self.on_stale_items_loaded,
+                    item_type=item_type
+                )
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to fetch items:\n{e}")
             self.btn_list.setEnabled(True)
             self.btn_force_refresh.setEnabled(True)
     
+    def on_stale_items_loaded(self, result: Optional[List[Dict[str, Any]]], error: str):
+        """Shows the expired disk cache, unless the fresh listing already arrived."""
+        if error:
+            self.logger.warning(f"Could not load stale Jellyfin cache: {error}")
+            return
+        if result is None or not self.list_pending:
+            return
+        
+        self.logger.info(f"Showing {len(result)} cached {self.listing_item_type} items while refreshing...")
+        self.items = result
+        self.populate_table(self.items)
+        self._set_stale_listing(
+            "Showing a cached listing while refreshing from Jellyfin. "
+            "Identify and Delete are disabled until the refresh finishes."
+        )
+
+    def _set_stale_listing(self, message: Optional[str]):
+        """Marks the table as holding a cached listing (message shown), or as current (None)."""
+        self.showing_stale = message is not None
+        self.stale_label.setText(message or "")
+        self.stale_label.setVisible(self.showing_stale)
+
     def on_list_finished(self, result: Optional[List[Dict[str, Any]]], error: str):
         # ... (This method remains the same) ...
+        self.list_pending = False
         self.btn_list.setEnabled(True)
         self.btn_force_refresh.setEnabled(True)
         
         if error or result is None:
             self.logger.error(f"Failed to fetch items: {error}")
+            if self.showing_stale:
+                self._set_stale_listing(
+                    "Refreshing from Jellyfin failed. These rows are a cached listing and may be out of date; "
+                    "Identify and Delete stay disabled until a listing loads."
+                )
             QMessageBox.critical(self, "Error", f"Failed to fetch items:\n{error}")
             self.event_bus.publish("service_status_changed", "jellyfin", "down")
             return
         
+        self._set_stale_listing(None)
         self.items = result
-        self.item_cache = result
-        self.last_fetch_time = time.time()
+        self.item_cache[self.listing_item_type] = (time.monotonic(), result)
         
         self.populate_table(self.items)
         self.btn_export.setEnabled(True)
         self.btn_find_duplicates.setEnabled(True)
         self.event_bus.publish("service_status_changed", "jellyfin", "up")
+        self.event_bus.publish("jellyfin_items_updated", self.listing_item_type, result)
     
     def populate_table(self, items: List[Dict[str, Any]]):
-        # ... (This method remains the same) ...
-        self.table.setSortingEnabled(False)
-        self.table.clearContents()
-        self.table.setRowCount(len(items))
-        
-        default_brush = QBrush()
-        
-        for i, item in enumerate(items):
-            original_index = -1
-            try:
-                original_index = self.items.index(item)
-            except ValueError:
-                original_index = i
-            
-            title_widget = QTableWidgetItem(item.get("Name", "N/A"))
-            title_widget.setData(Qt.ItemDataRole.UserRole, original_index)
-            title_widget.setBackground(default_brush)
-            
-            year_widget = QTableWidgetItem(str(item.get("ProductionYear", "N/A")))
-            year_widget.setBackground(default_brush)
-
-            path_widget = QTableWidgetItem(item.get("Path", "N/A"))
-            path_widget.setBackground(default_brush)
-            
-            self.table.setItem(i, 0, title_widget)
-            self.table.setItem(i, 1, year_widget)
-            self.table.setItem(i, 2, path_widget)
-            
-            self.table.setRowHidden(i, False)
+        """Shows `items` (always self.items, so each row's UserRole indexes into it)."""
+        if self.showing_duplicates:
+            self.proxy_model.set_allowed_items(None)
+        self.item_model.set_items(items)
         
         self.logger.info(f"Displayed {len(items)} items in table.")
-        self.table.setSortingEnabled(True)
         
         self.showing_duplicates = False
         self.btn_find_duplicates.setText("Find Duplicates")
         self.filter_input.setEnabled(True)
+
+    def hide_duplicate_view(self):
+        """Leaves the duplicate view in place: no model reset, just drop the highlights and the row restriction."""
+        self.item_model.set_row_backgrounds({})
+        self.proxy_model.set_allowed_items(None)
+        self.showing_duplicates = False
+        self.btn_find_duplicates.setText("Find Duplicates")
+        self.filter_input.setEnabled(True)
     
     def export_to_csv(self):
         # ... (This method remains the same) ...
@@ -994,32 +1420,29 @@ class JellyfinTab(QWidget):
         if not file_path:
             return
         
-        try:
-            with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(["Title", "Year", "Path", "TMDB ID", "TVDB ID", "IMDb ID"])
-                
-                for item in self.items:
-                    provider_ids = item.get("ProviderIds", {})
-                    writer.writerow([
-                        item.get("Name", ""),
-                        item.get("ProductionYear", ""),
-                        item.get("Path", ""),
-                        provider_ids.get("Tmdb", ""),
-                        provider_ids.get("Tvdb", ""),
-                        provider_ids.get("Imdb", "")
-                    ])
-            
-            self.logger.info(f"Exported {len(self.items)} items to {file_path}")
-            QMessageBox.information(self, "Success", f"Exported {len(self.items)} items to CSV.")
-        except Exception as e:
-            self.logger.error(f"Failed to export CSV: {e}")
-            QMessageBox.critical(self, "Export Error", f"Failed to export:\n{e}")
+        self.btn_export.setEnabled(False)
+        self._start_worker(
+            "export_thread", "export_worker",
+            self._task_export_csv,
+            self.on_export_finished,
+            file_path=file_path,
+            items=self.items
+        )
+
+    def on_export_finished(self, result: Optional[Dict[str, Any]], error: str):
+        self.btn_export.setEnabled(bool(self.items))
+        
+        if error or result is None:
+            self.logger.error(f"Failed to export CSV: {error}")
+            QMessageBox.critical(self, "Export Error", f"Failed to export:\n{error}")
+            return
+        
+        self.logger.info(f"Exported {result['count']} items to {result['file_path']}")
+        QMessageBox.information(self, "Success", f"Exported {result['count']} items to CSV.")
  
     def filter_table(self):
         # ... (This method remains the same) ...
         filter_text = self.filter_input.text().strip().lower()
-        visible_rows = 0
         
         if not self.items:
              self.btn_add_missing.setVisible(False)
@@ -1029,17 +1452,8 @@ class JellyfinTab(QWidget):
             self.show_duplicate_view(filter_text)
             return
 
-        for i in range(self.table.rowCount()):
-            item = self.table.item(i, 0)
-            if item:
-                title = item.text().lower()
-                if filter_text in title:
-                    self.table.setRowHidden(i, False)
-                    visible_rows += 1
-                else:
-                    self.table.setRowHidden(i, True)
-            else:
-                self.table.setRowHidden(i, True)
+        self.proxy_model.setFilterFixedString(filter_text)
+        visible_rows = self.proxy_model.rowCount()
 
         if visible_rows == 0 and len(filter_text) > 2:
             item_type = self.type_combo.currentText()
@@ -1089,7 +1503,7 @@ class JellyfinTab(QWidget):
             identify_action = menu.addAction("Identify...")
             
             row = selected_rows[0].row()
-            item_index = self.table.item(row, 0).data(Qt.ItemDataRole.UserRole)
+            item_index = selected_rows[0].data(_USER_ROLE)
             try:
                 item_data = self.items[item_index]
                 identify_action.triggered.connect(lambda: self.open_identify_dialog(item_data))
@@ -1106,13 +1520,14 @@ class JellyfinTab(QWidget):
             
             menu.addSeparator()
             bulk_delete_action = menu.addAction(f"Delete {len(selected_rows)} items from Jellyfin...")
-            item_indices = []
-            for row_model in selected_rows:
-                row = row_model.row()
-                item_index = self.table.item(row, 0).data(Qt.ItemDataRole.UserRole)
-                item_indices.append(item_index)
+            item_indices = [row_index.data(_USER_ROLE) for row_index in selected_rows]
             bulk_delete_action.triggered.connect(lambda: self.delete_jellyfin_items(item_indices))
 
+        if self.showing_stale:
+            # The cached rows may no longer match the server; don't act on them
+            for action in menu.actions():
+                action.setEnabled(False)
+
         menu.exec(self.table.viewport().mapToGlobal(pos))
 
     def open_identify_dialog(self, item_data: Dict[str, Any]):
@@ -1154,12 +1569,12 @@ class JellyfinTab(QWidget):
             else:
                 self.logger.info("Identify dialog closed without selection.")
 
-    def start_bulk_identify(self, selected_rows: List[QTableWidgetItem]):
+    def start_bulk_identify(self, selected_rows: List[QModelIndex]):
         # ... (This method is updated to pass secure_storage) ...
         items_to_identify = []
         for row in selected_rows:
             try:
-                item_index = self.table.item(row.row(), 0).data(Qt.ItemDataRole.UserRole)
+                item_index = row.data(_USER_ROLE)
                 items_to_identify.append(self.items[item_index])
             except Exception as e:
                 logger.error(f"Failed to get item data for bulk identify: {e}")
@@ -1188,33 +1603,39 @@ class JellyfinTab(QWidget):
         self.process_next_apply_job()
 
     def process_next_apply_job(self):
-        # ... (This method remains the same) ...
+        """Drains everything queued so far into one concurrent batch."""
         if self.apply_job_running or not self.apply_queue:
             return 
             
         self.apply_job_running = True
-        item_id, selected_result = self.apply_queue.pop(0)
+        jobs = self.apply_queue
+        self.apply_queue = []
         
-        self.logger.info(f"Starting 'Apply Identification' job for item {item_id} (Queue size: {len(self.apply_queue)})")
+        self.logger.info(f"Starting 'Apply Identification' batch for {len(jobs)} item(s)")
         
         self._start_worker(
             "apply_thread", "apply_worker",
-            self._task_apply_identification,
+            self._task_apply_identifications,
             self.on_apply_finished,
-            item_id=item_id,
-            search_result=selected_result
+            jobs=jobs
         )
 
     def on_apply_finished(self, result: Optional[Dict[str, Any]], error: str):
-        # ... (This method remains the same) ...
         self.apply_job_running = False
         if error or result is None:
             logger.error(f"Failed to apply identification: {error}")
             QMessageBox.critical(self, "Error", f"Failed to apply identification:\n{error}")
         else:
-            logger.info("Successfully applied new identification. Forcing list refresh.")
-            self.list_items(force_refresh=True)
+            if result["errors"]:
+                QMessageBox.critical(
+                    self, "Error",
+                    f"Failed to apply identification for {len(result['errors'])} item(s):\n" + "\n".join(result["errors"][:10])
+                )
+            if result["applied"]:
+                logger.info(f"Applied new identification to {len(result['applied'])} item(s). Forcing list refresh.")
+                self.list_items(force_refresh=True)
             
+        # One readiness ping per batch; jobs queued meanwhile run as the next batch.
         self.check_jellyfin_readiness()
 
     def delete_jellyfin_items(self, item_indices: List[int]):
@@ -1251,7 +1672,8 @@ class JellyfinTab(QWidget):
         
         self.logger.info(f"Starting deletion of {len(item_ids)} items from Jellyfin (delete_files={delete_files})")
         
-        self.pending_delete_failures.clear() # Clear old failures
+        with self._delete_failures_lock:
+            self.pending_delete_failures.clear() # Clear old failures
         
         self._start_worker(
             "delete_thread", "delete_worker",
@@ -1330,7 +1752,7 @@ class JellyfinTab(QWidget):
     def toggle_duplicate_view(self):
         # ... (This method remains the same) ...
         if self.showing_duplicates:
-            self.populate_table(self.items)
+            self.hide_duplicate_view()
             self.filter_input.clear()
         else:
             self.show_duplicate_view()
@@ -1346,60 +1768,39 @@ class JellyfinTab(QWidget):
                 return
             self.logger.info(f"Found {len(self.duplicate_groups)} duplicate groups. Filtering table.")
         
-        self.table.setSortingEnabled(False)
-        
         color1 = QBrush(QColor("#3E3E42"))
         color2 = QBrush(QColor("#252526"))
-        color_toggle = True
         
-        duplicate_item_indices = set()
+        # Item index -> index of the first group it belongs to
+        names_lower = self.item_model.names_lower
+        group_by_index = {}
         
-        for group in self.duplicate_groups:
-            current_color = color1 if color_toggle else color2
+        for group_index, group in enumerate(self.duplicate_groups):
+            if title_filter and not any(title_filter in names_lower[i] for i in group):
+                continue
+            for original_index in group:
+                group_by_index.setdefault(original_index, group_index)
             
-            show_group = False
-            if not title_filter:
-                show_group = True
-            else:
-                for item in group:
-                    if title_filter in item.get("Name", "").lower():
-                        show_group = True
-                        break
-            
-            if show_group:
-                for item in group:
-                    try:
-                        original_index = self.items.index(item)
-                        duplicate_item_indices.add(original_index)
-                    except ValueError:
-                        pass
-                color_toggle = not color_toggle
-            
-        for i in range(self.table.rowCount()):
-            original_index = self.table.item(i, 0).data(Qt.ItemDataRole.UserRole)
-            if original_index in duplicate_item_indices:
-                self.table.setRowHidden(i, False)
-                for group in self.duplicate_groups:
-                    if self.items[original_index] in group:
-                        group_index = self.duplicate_groups.index(group)
-                        current_color = color1 if (group_index % 2 == 0) else color2
-                        for col in range(self.table.columnCount()):
-                            self.table.item(i, col).setBackground(current_color)
-                        break
-            else:
-                self.table.setRowHidden(i, True)
-
-        self.table.setSortingEnabled(True)
+        self.item_model.set_row_backgrounds({
+            original_index: color1 if (group_index % 2 == 0) else color2
+            for original_index, group_index in group_by_index.items()
+        })
+        
+        # The duplicate view applies title_filter per group itself, then
+        # restricts the proxy to the grouped items in a single refilter
+        self.proxy_model.setFilterFixedString("")
+        self.proxy_model.set_allowed_items(set(group_by_index))
         self.btn_find_duplicates.setText("Show All Items")
         self.showing_duplicates = True
         self.filter_input.setEnabled(True)
 
-    def _identify_duplicate_groups(self) -> List[List[Dict]]:
-        # ... (This method remains the same) ...
-        by_provider_id = defaultdict(list)
-        by_name_year = defaultdict(list)
-        
+    def _get_dup_blacklist_pattern(self) -> Optional[re.Pattern]:
+        """Compiles the 'Dup Blacklist' words into one pattern, recompiling only when the text changes."""
         blacklist_text = self.dup_blacklist_input.text()
+        cached_text, cached_pattern = self._dup_blacklist_cache
+        if blacklist_text == cached_text:
+            return cached_pattern
+        
         blacklist = [w.strip().lower() for w in blacklist_text.split(',') if w.strip()]
         
         blacklist_pattern = None
@@ -1407,44 +1808,61 @@ class JellyfinTab(QWidget):
             escaped_words = [re.escape(w) for w in blacklist]
             pattern_str = '|'.join(escaped_words)
             blacklist_pattern = re.compile(pattern_str, re.IGNORECASE)
+        
+        self._dup_blacklist_cache = (blacklist_text, blacklist_pattern)
+        return blacklist_pattern
+
+    def _identify_duplicate_groups(self) -> List[List[int]]:
+        """Groups likely duplicates; each group is a list of indices into self.items."""
+        # Reuse the last grouping while the listing and blacklist are unchanged
+        blacklist_text = self.dup_blacklist_input.text()
+        cached_items, cached_text, cached_groups = self._dup_groups_cache
+        if cached_items is self.items and cached_text == blacklist_text:
+            return cached_groups
+        
+        by_provider_id = defaultdict(list)
+        by_name_year = defaultdict(list)
+        
+        blacklist_pattern = self._get_dup_blacklist_pattern()
+        names_lower = self.item_model.names_lower
 
-        for item in self.items:
+        for index, item in enumerate(self.items):
             provider_ids = item.get("ProviderIds", {})
             tmdb = provider_ids.get("Tmdb")
             tvdb = provider_ids.get("Tvdb")
             
             matched_by_id = False
             if tmdb:
-                by_provider_id[f"tmdb_{tmdb}"].append(item)
+                by_provider_id[f"tmdb_{tmdb}"].append(index)
                 matched_by_id = True
             if tvdb:
-                by_provider_id[f"tvdb_{tvdb}"].append(item)
+                by_provider_id[f"tvdb_{tvdb}"].append(index)
                 matched_by_id = True
 
             if not matched_by_id:
-                name = item.get("Name", "")
                 year = item.get("ProductionYear")
                 
-                scrubbed_name = name.lower()
+                scrubbed_name = names_lower[index]
                 if blacklist_pattern:
                     scrubbed_name = blacklist_pattern.sub("", scrubbed_name)
                 
-                scrubbed_name = re.sub(r'[\.\[\]\(\)\-_{}]', ' ', scrubbed_name)
-                scrubbed_name = re.sub(r'\s+', ' ', scrubbed_name).strip(" -")
+                scrubbed_name = scrubbed_name.translate(_SCRUB_PUNCT_TABLE)
+                scrubbed_name = _SCRUB_WS_RE.sub(' ', scrubbed_name).strip(" -")
                 
                 if scrubbed_name:
                     key = f"{scrubbed_name}|{year}"
-                    by_name_year[key].append(item)
+                    by_name_year[key].append(index)
                 
         final_duplicate_sets = []
-        for items in by_provider_id.values():
-            if len(items) > 1:
-                final_duplicate_sets.append(items)
+        for indices in by_provider_id.values():
+            if len(indices) > 1:
+                final_duplicate_sets.append(indices)
                 
-        for items in by_name_year.values():
-            if len(items) > 1:
-                final_duplicate_sets.append(items)
+        for indices in by_name_year.values():
+            if len(indices) > 1:
+                final_duplicate_sets.append(indices)
                 
+        self._dup_groups_cache = (self.items, blacklist_text, final_duplicate_sets)
         return final_duplicate_sets
     
 #
@@ -1467,7 +1885,10 @@ class JellyfinPlugin(PluginBase):
         return "Manage Jellyfin library, find duplicates, and delete with optional file removal"
     
     def get_widget(self) -> QWidget:
-        # Create and return the tab widget, passing all core services
+        # Create the tab widget once (the main window calls this on every
+        # tab change), passing all core services
+        if self.widget is not None:
+            return self.widget
         self.widget = JellyfinTab(
             self.logger, 
             self.settings, 
@@ -1487,4 +1908,5 @@ class JellyfinPlugin(PluginBase):
         """Stop any running threads on shutdown."""
         if self.widget:
             self.event_bus.unsubscribe("request_all_status", self.widget.check_jellyfin_status)
+            self.event_bus.unsubscribe("settings_changed", self.widget.on_settings_changed)
             self.event_bus.unsubscribe("filesystem_delete_failure", self.widget.on_filesystem_delete_failed)
\ No newline at end of file
@@ -3,20 +3,17 @@
 Lidarr Plugin - Music management
 Inherits from ArrTab and provides Lidarr-specific overrides for API v1.
 """
-import logging
-from PyQt6.QtWidgets import QWidget, QComboBox, QHBoxLayout, QLabel
+from PyQt6.QtWidgets import QComboBox, QHBoxLayout, QLabel
 from typing import Dict, Any, List
 
-from core.plugin_base import PluginBase
-from core.api_client import ApiClient
-from core.settings_manager import SettingsManager
-from core.secure_storage import SecureStorage
-from core.event_bus import EventBus
-from .plugin_arr_base import ArrTab # Import the base class
+from .plugin_arr_base import ArrTab, ArrPluginBase # Import the base classes
 
 # Define a Lidarr-specific tab
 class LidarrTab(ArrTab):
 
+    # Combo box text -> search type; the combo only ever holds these two
+    _SEARCH_TYPE_MAP = {"Artist": "artist", "Album": "album"}
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         
@@ -34,9 +31,10 @@ class LidarrTab(ArrTab):
         
         # Set initial search type
         self.current_search_type = "artist"
+        self._search_urls = ("", {})  # (base_url, {search_type: url}), rebuilt when the URL changes
 
     def _on_search_type_changed(self, text: str):
-        self.current_search_type = text.lower()
+        self.current_search_type = self._SEARCH_TYPE_MAP.get(text, "artist")
 
     # --- Override Properties ---
     
@@ -61,19 +59,23 @@ class LidarrTab(ArrTab):
         Worker task to search for a Lidarr item (Artist or Album).
         """
         base_url, api_key = self._get_arr_base_url()
+        if self._search_urls[0] != base_url:
+            self._search_urls = (base_url, {
+                "album": f"{base_url}/api/v1/album/lookup",
+                # Artist-only lookup: the combined /search endpoint also returns
+                # every matching album, which was downloaded and parsed only to
+                # be thrown away when unwrapping the artists.
+                "artist": f"{base_url}/api/v1/artist/lookup",
+            })
+        search_urls = self._search_urls[1]
+        params = {"term": term}
         
         if search_type == "album":
             self.logger.info(f"Lidarr searching for ALBUM: {term}...")
-            endpoint = f"{base_url}/api/v1/album/lookup"
-            params = {"term": term}
-            response = self.api_client.api_request(endpoint, api_key, self.service_name, params=params)
+            response = self.api_client.api_request(search_urls["album"], api_key, self.service_name, params=params)
         else: # artist
             self.logger.info(f"Lidarr searching for ARTIST: {term}...")
-            endpoint = f"{base_url}/api/v1/search"
-            params = {"term": term}
-            response = self.api_client.api_request(endpoint, api_key, self.service_name, params=params)
-            # Unwrap artist from response
-            response = [item.get("artist") for item in response if item.get("artist")]
+            response = self.api_client.api_request(search_urls["artist"], api_key, self.service_name, params=params)
 
         return response if response else []
 
@@ -84,30 +86,36 @@ class LidarrTab(ArrTab):
             # We can't add an album directly, we must add the artist
             raise ValueError("Adding albums directly is not supported by this tool. Please search for and add the artist.")
 
-        return {
+        try:
+            quality_profile_id = item_data["quality_profile_id"]
+            root_folder_path = item_data["root_folder_path"]
+        except KeyError as e:
+            raise ValueError(f"Missing required add field: {e}") from None
+
+        payload = {
             "foreignArtistId": item_json.get("foreignArtistId"),
             "artistName": item_json.get("artistName"),
-            "qualityProfileId": item_data["quality_profile_id"],
+            "qualityProfileId": quality_profile_id,
             "metadataProfileId": 1, # Default metadata profile
-            "rootFolderPath": item_data["root_folder_path"],
+            "rootFolderPath": root_folder_path,
             "monitored": True,
             "addOptions": {
                 "searchForMissingAlbums": True,
                 "monitor": "all"
-            },
-            **{k: item_json[k] for k in ["artistName", "foreignArtistId", "images"] if k in item_json}
+            }
         }
+        images = item_json.get("images")
+        if images is not None:
+            payload["images"] = images
+        return payload
 
 # Define the plugin wrapper
-class LidarrPlugin(PluginBase):
+class LidarrPlugin(ArrPluginBase):
     """Lidarr music management."""
-    
-    def __init__(self, logger: logging.Logger, settings: SettingsManager, secure_storage: SecureStorage, api_client: ApiClient, event_bus: EventBus):
-        super().__init__(logger, settings, secure_storage, api_client, event_bus)
-        self.widget = None
-    
-    def get_name(self) -> str:
-        return "lidarr"
+    __slots__ = ()
+    TAB_CLASS = LidarrTab
+    SERVICE_NAME = "lidarr"
+    TAB_NAME = "Lidarr (Music)"
     
     def get_version(self) -> str:
         return "2.0.0"
@@ -115,26 +123,5 @@ class LidarrPlugin(PluginBase):
     def get_description(self) -> str:
         return "Manage music with Lidarr"
     
-    def get_widget(self) -> QWidget:
-        self.widget = LidarrTab(
-            service_name="lidarr",
-            logger=self.logger,
-            settings=self.settings,
-            secure_storage=self.secure_storage,
-            api_client=self.api_client,
-            event_bus=self.event_bus
-        )
-        return self.widget
-    
-    def get_tab_name(self) -> str:
-        return "Lidarr (Music)"
-    
     def get_icon(self) -> str:
         return "🎵"
-
-    def cleanup(self):
-        if self.widget:
-            if self.widget.status_thread: self.widget.status_thread.quit()
-            if self.widget.folders_thread: self.widget.folders_thread.quit()
-            if self.widget.profiles_thread: self.widget.profiles_thread.quit()
-            if self.widget.search_thread: self.widget.search_thread.quit()
\ No newline at end of file
@@ -10,11 +10,21 @@ from core.settings_manager import SettingsManager
 from core.secure_storage import SecureStorage
 from core.api_client import ApiClient
 from core.event_bus import EventBus
+from ui.widgets import LazyWidget
 import logging
 
 
+# Placeholder tab contents, built only when the tab is first shown
+_PROWLARR_HTML = (
+    "<h2>🔍 Prowlarr Plugin</h2>"
+    "<p><b>Phase 3 - Smart Integration</b></p>"
+    "<p>This service will be implemented in Phase 3.</p>"
+    "<p>When enabled, this plugin will provide search results to other plugins.</p>"
+)
+
 class ProwlarrPlugin(PluginBase):
     """Prowlarr indexer management."""
+    __slots__ = ("widget",)
     
     def __init__(self, logger: logging.Logger, settings: SettingsManager, secure_storage: SecureStorage, api_client: ApiClient, event_bus: EventBus):
         super().__init__(logger, settings, secure_storage, api_client, event_bus)
@@ -31,19 +41,15 @@ class ProwlarrPlugin(PluginBase):
     
     def get_widget(self) -> QWidget:
         if not self.widget:
-            self.widget = QWidget()
-            layout = QVBoxLayout(self.widget)
-            
-            label = QLabel(
-                "<h2>🔍 Prowlarr Plugin</h2>"
-                "<p><b>Phase 3 - Smart Integration</b></p>"
-                "<p>This service will be implemented in Phase 3.</p>"
-                "<p>When enabled, this plugin will provide search results to other plugins.</p>"
-            )
-            label.setWordWrap(True)
-            layout.addWidget(label)
-        
+            self.widget = LazyWidget(self._build_placeholder)
         return self.widget
+
+    def _build_placeholder(self, widget: QWidget):
+        """Fills the tab on first show."""
+        layout = QVBoxLayout(widget)
+        label = QLabel(_PROWLARR_HTML)
+        label.setWordWrap(True)
+        layout.addWidget(label)
     
     def get_tab_name(self) -> str:
         return "Prowlarr (Search)"
@@ -52,7 +58,4 @@ class ProwlarrPlugin(PluginBase):
         return "🔍"
     
     def is_enabled(self) -> bool:
-        enabled = self.settings.get_plugin_setting("prowlarr", "enabled", False)
-        url = self.settings.get_plugin_setting("prowlarr", "url", "")
-        api_key = self.secure_storage.get_credential("prowlarr_api_key")
-        return enabled and bool(url and api_key)
\ No newline at end of file
+        return self._is_enabled_cached("prowlarr", "prowlarr_api_key", require_enabled_flag=True)
\ No newline at end of file
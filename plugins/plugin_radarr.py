@@ -3,16 +3,9 @@
 Radarr Plugin - Movie management
 Inherits from ArrTab and uses the default (v3) logic.
 """
-import logging
-from PyQt6.QtWidgets import QWidget
 from typing import Dict, Any
 
-from core.plugin_base import PluginBase
-from core.api_client import ApiClient
-from core.settings_manager import SettingsManager
-from core.secure_storage import SecureStorage
-from core.event_bus import EventBus
-from .plugin_arr_base import ArrTab # Import the base class
+from .plugin_arr_base import ArrTab, ArrPluginBase # Import the base classes
 
 # Define a Radarr-specific tab
 class RadarrTab(ArrTab):
@@ -33,26 +26,27 @@ class RadarrTab(ArrTab):
 
     def _build_add_payload(self, item_json: Dict[str, Any], item_data: Dict[str, Any]) -> Dict[str, Any]:
         """Builds the JSON payload for adding a Radarr movie."""
-        return {
+        payload = {
             "tmdbId": item_json.get("tmdbId"),
             "title": item_json.get("title"),
             "qualityProfileId": item_data["quality_profile_id"],
             "rootFolderPath": item_data["root_folder_path"],
             "monitored": True,
-            "addOptions": { "searchForMovie": True },
-            **{k: item_json[k] for k in ["titleSlug", "images", "year"] if k in item_json}
+            "addOptions": { "searchForMovie": True }
         }
+        for key in ("titleSlug", "images", "year"):
+            value = item_json.get(key)
+            if value is not None:
+                payload[key] = value
+        return payload
 
 # Define the plugin wrapper
-class RadarrPlugin(PluginBase):
+class RadarrPlugin(ArrPluginBase):
     """Radarr movie management."""
-    
-    def __init__(self, logger: logging.Logger, settings: SettingsManager, secure_storage: SecureStorage, api_client: ApiClient, event_bus: EventBus):
-        super().__init__(logger, settings, secure_storage, api_client, event_bus)
-        self.widget = None
-    
-    def get_name(self) -> str:
-        return "radarr"
+    __slots__ = ()
+    TAB_CLASS = RadarrTab
+    SERVICE_NAME = "radarr"
+    TAB_NAME = "Radarr (Movies)"
     
     def get_version(self) -> str:
         return "2.0.0"
@@ -60,26 +54,5 @@ class RadarrPlugin(PluginBase):
     def get_description(self) -> str:
         return "Manage movies with Radarr"
     
-    def get_widget(self) -> QWidget:
-        self.widget = RadarrTab(
-            service_name="radarr",
-            logger=self.logger,
-            settings=self.settings,
-            secure_storage=self.secure_storage,
-            api_client=self.api_client,
-            event_bus=self.event_bus
-        )
-        return self.widget
-    
-    def get_tab_name(self) -> str:
-        return "Radarr (Movies)"
-    
     def get_icon(self) -> str:
         return "🎞️"
-
-    def cleanup(self):
-        if self.widget:
-            if self.widget.status_thread: self.widget.status_thread.quit()
-            if self.widget.folders_thread: self.widget.folders_thread.quit()
-            if self.widget.profiles_thread: self.widget.profiles_thread.quit()
-            if self.widget.search_thread: self.widget.search_thread.quit()
\ No newline at end of file
@@ -10,10 +10,20 @@ from core.settings_manager import SettingsManager
 from core.secure_storage import SecureStorage
 from core.api_client import ApiClient
 from core.event_bus import EventBus
+from ui.widgets import LazyWidget
 import logging
 
+# Placeholder tab contents, built only when the tab is first shown
+_READARR_HTML = (
+    "<h2>📚 Readarr Plugin</h2>"
+    "<p><b>Phase 3 - New Service</b></p>"
+    "<p>This service will be implemented in Phase 3.</p>"
+    "<p>It will be a wrapper for the shared ArrTab logic.</p>"
+)
+
 class ReadarrPlugin(PluginBase):
     """Readarr book management."""
+    __slots__ = ("widget",)
     
     def __init__(self, logger: logging.Logger, settings: SettingsManager, secure_storage: SecureStorage, api_client: ApiClient, event_bus: EventBus):
         super().__init__(logger, settings, secure_storage, api_client, event_bus)
@@ -30,19 +40,15 @@ class ReadarrPlugin(PluginBase):
     
     def get_widget(self) -> QWidget:
         if not self.widget:
-            self.widget = QWidget()
-            layout = QVBoxLayout(self.widget)
-            
-            label = QLabel(
-                "<h2>📚 Readarr Plugin</h2>"
-                "<p><b>Phase 3 - New Service</b></p>"
-                "<p>This service will be implemented in Phase 3.</p>"
-                "<p>It will be a wrapper for the shared ArrTab logic.</p>"
-            )
-            label.setWordWrap(True)
-            layout.addWidget(label)
-        
+            self.widget = LazyWidget(self._build_placeholder)
         return self.widget
+
+    def _build_placeholder(self, widget: QWidget):
+        """Fills the tab on first show."""
+        layout = QVBoxLayout(widget)
+        label = QLabel(_READARR_HTML)
+        label.setWordWrap(True)
+        layout.addWidget(label)
     
     def get_tab_name(self) -> str:
         return "Readarr (Books)"
@@ -51,6 +57,4 @@ class ReadarrPlugin(PluginBase):
         return "📚"
     
     def is_enabled(self) -> bool:
-        url = self.settings.get_plugin_setting("readarr", "url", "")
-        api_key = self.secure_storage.get_credential("readarr_api_key")
-        return bool(url and api_key)
\ No newline at end of file
+        return self._is_enabled_cached("readarr", "readarr_api_key")
\ No newline at end of file
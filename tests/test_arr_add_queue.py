@@ -0,0 +1,76 @@
+# arr_omnitool/tests/test_arr_add_queue.py
+"""
+ArrTab search/add queue: picks confirmed in one run must survive a new run
+started before they were posted.
+Run from the project root: python -m unittest discover -s tests
+"""
+import logging
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication
+
+from core import ApiClient, EventBus, SecureStorage, SettingsManager
+from plugins.plugin_arr_base import ArrTab
+
+_app = QApplication.instance() or QApplication([])
+
+
+class _FakeWorker:
+    def stop(self):
+        pass
+
+
+class QueuedArrTab(ArrTab):
+    """ArrTab whose workers are recorded instead of run, so the test drives their results."""
+
+    def __init__(self, *args, **kwargs):
+        self.started = []  # (task key, task kwargs, finished slot)
+        super().__init__(*args, **kwargs)
+
+    def _start_worker(self, task_key, task_function, on_finished_slot, **task_kwargs):
+        if task_key in self._tasks:
+            return
+        self._tasks[task_key] = _FakeWorker()
+        self.started.append((task_key, task_kwargs, on_finished_slot))
+
+    def finish(self, task_key, result):
+        """Completes the latest task started under `task_key` with `result`."""
+        _key, _kwargs, slot = [entry for entry in self.started if entry[0] == task_key][-1]
+        self._tasks.pop(task_key, None)
+        slot(result, "")
+
+
+class AddQueueTest(unittest.TestCase):
+    def setUp(self):
+        self.tab = QueuedArrTab(
+            "sonarr", logging.getLogger("test"), SettingsManager(), SecureStorage(),
+            ApiClient(), EventBus()
+        )
+        self.tab.combo_root_folder.addItem("/tv", {"id": 1, "path": "/tv"})
+        self.tab.combo_quality_profile.addItem("HD", {"id": 4})
+
+    def test_new_add_mid_batch_keeps_earlier_picks(self):
+        tab = self.tab
+        # A CSV-style batch: the first term's pick is queued while more searches remain
+        tab.terms_to_add_queue = ["first", "second", "third"]
+        tab.terms_to_add_total_count = 3
+        tab.process_next_item_in_queue()
+        tab.finish("search", [{"title": "First"}])
+        self.assertEqual(len(tab.items_to_add_queue), 1)
+
+        # A new add from the text box supersedes the rest of the batch
+        tab.search_input.setText("another")
+        tab.add_from_text()
+        tab.finish("search", [{"title": "Another"}])
+
+        add_calls = [kwargs for key, kwargs, _slot in tab.started if key == "add"]
+        self.assertEqual(len(add_calls), 1)
+        titles = [item["item_json"]["title"] for item in add_calls[0]["items_data"]]
+        self.assertEqual(titles, ["First", "Another"])
+
+
+if __name__ == "__main__":
+    unittest.main()
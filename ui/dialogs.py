@@ -4,21 +4,133 @@ Shared UI dialogs (Selection, Identify, Bulk Identify)
 Refactored to include a blacklist panel for scrubbing search terms.
 """
 
+import json
 import logging
-from typing import Optional, List, Dict, Any
+import re
+from typing import Optional, List, Dict, Any, Callable, Sequence, Tuple
 from PyQt6.QtWidgets import (
-    QDialog, QTableWidget, QTableWidgetItem, QPushButton, QVBoxLayout,
+    QDialog, QTableView, QPushButton, QVBoxLayout,
     QLineEdit, QFormLayout, QDialogButtonBox, QMessageBox, QHBoxLayout,
     QLabel, QHeaderView, QTextEdit, QFileDialog, QSplitter, QWidget,
     QGridLayout
 )
-from PyQt6.QtCore import QSettings, QThread, QTimer, pyqtSignal, Qt
-from core.api_client import ApiWorker, ApiClient
+from PyQt6.QtCore import (
+    QSettings, QThreadPool, QTimer, pyqtSignal, Qt,
+    QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+)
+from PyQt6.QtGui import QTextCursor
+from core.api_client import ApiRunnable, ApiClient
 from core.settings_manager import SettingsManager
-from core.utils import scrub_name, parse_csv_to_list, save_list_to_csv
+from core.utils import scrub_name, scrub_names, compile_blacklist, blacklist_digest, parse_csv_to_list, save_list_to_csv
 
 logger = logging.getLogger(__name__)
 
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+
+OVERVIEW_PREVIEW_LENGTH = 100  # Characters of overview shown in result tables
+
+def _format_overview(overview: Optional[str]) -> str:
+    """Shortens an overview for display, adding '...' only when it was actually cut."""
+    if not overview:
+        return ""
+    if len(overview) <= OVERVIEW_PREVIEW_LENGTH:
+        return overview
+    return overview[:OVERVIEW_PREVIEW_LENGTH] + "..."
+
+# (header, extractor) pairs; extractors turn one result dict into a cell string
+Column = Tuple[str, Callable[[Dict[str, Any]], str]]
+
+LIDARR_ALBUM_COLUMNS: Tuple[Column, ...] = (
+    ("Album", lambda it: it.get("title", "Unknown")),
+    ("Artist", lambda it: it.get("artist", {}).get("artistName", "Unknown")),
+    ("Year", lambda it: str(it.get("releaseDate", "N/A"))[:4]),
+)
+LIDARR_ARTIST_COLUMNS: Tuple[Column, ...] = (
+    ("Artist", lambda it: it.get("artistName", "Unknown")),
+    ("Disambiguation", lambda it: it.get("disambiguation", "")),
+    ("Overview", lambda it: _format_overview(it.get("overview"))),
+)
+ARR_COLUMNS: Tuple[Column, ...] = (
+    ("Title", lambda it: it.get("title", "Unknown")),
+    ("Year", lambda it: str(it.get("year", ""))),
+    ("Overview", lambda it: _format_overview(it.get("overview"))),
+)
+REMOTE_SEARCH_COLUMNS: Tuple[Column, ...] = (
+    ("Title", lambda it: it.get("Name", "N/A")),
+    ("Year", lambda it: str(it.get("ProductionYear", "N/A"))),
+    ("Provider", lambda it: ", ".join(f"{k}: {v}" for k, v in (it.get("ProviderIds") or {}).items() if v)),
+    ("Overview", lambda it: _format_overview(it.get("Overview"))),
+)
+# Fixed widths for all but the last (stretched) column, so sizing never scans rows
+REMOTE_SEARCH_COLUMN_WIDTHS = (220, 60, 180)
+
+
+# --- Results Model ---
+class ResultsModel(QAbstractTableModel):
+    """
+    Read-only table model over a list of search result dicts.
+    Cells are produced on demand in data(), so only visible rows are formatted,
+    and each is kept until the rows change since Qt asks for it on every repaint.
+    The result dicts themselves are never modified (one may be posted back as-is).
+    """
+    def __init__(self, columns: Sequence[Column], parent=None):
+        super().__init__(parent)
+        self._headers = tuple(header for header, _ in columns)
+        self._extractors = tuple(extractor for _, extractor in columns)
+        self._rows: List[Dict[str, Any]] = []
+        self._cells: Dict[Tuple[int, int], str] = {}
+
+    def set_rows(self, rows: List[Dict[str, Any]]):
+        """Replaces the results shown (the list is wrapped, not copied)."""
+        self.beginResetModel()
+        self._rows = rows
+        self._cells = {}
+        self.endResetModel()
+
+    def row_data(self, row: int) -> Dict[str, Any]:
+        return self._rows[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section, orientation, role=_DISPLAY_ROLE):
+        if role == _DISPLAY_ROLE and orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return None
+
+    def data(self, index, role=_DISPLAY_ROLE):
+        if role != _DISPLAY_ROLE:
+            return None
+        key = (index.row(), index.column())
+        text = self._cells.get(key)
+        if text is None:
+            text = self._cells[key] = self._extractors[key[1]](self._rows[key[0]])
+        return text
+
+
+def make_results_table(model: QAbstractTableModel, selection_mode,
+                        column_widths: Sequence[int] = ()) -> QTableView:
+    """Creates the row-selecting results view shared by the dialogs below."""
+    table = QTableView()
+    table.setModel(model)
+    header = table.horizontalHeader()
+    header.setStretchLastSection(True)
+    for col, width in enumerate(column_widths):
+        header.resizeSection(col, width)
+    # One fixed, unwrapped line per row: no per-row height measuring
+    rows = table.verticalHeader()
+    rows.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    rows.setDefaultSectionSize(rows.fontMetrics().height() + 6)
+    rows.setVisible(False)
+    table.setWordWrap(False)
+    table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+    table.setSelectionMode(selection_mode)
+    return table
+
+
 # --- Selection Dialog (Updated) ---
 class SelectionDialog(QDialog):
     """
@@ -40,53 +152,27 @@ class SelectionDialog(QDialog):
         info_label = QLabel(f"Found {len(results)} results for '{search_term}'. Please select one or more:")
         layout.addWidget(info_label)
         
-        self.table = QTableWidget()
-        
         if service == "lidarr" and search_type == "album":
-            self.table.setColumnCount(3)
-            self.table.setHorizontalHeaderLabels(["Album", "Artist", "Year"])
+            columns = LIDARR_ALBUM_COLUMNS
         elif service == "lidarr" and search_type == "artist":
-            self.table.setColumnCount(3)
-            self.table.setHorizontalHeaderLabels(["Artist", "Disambiguation", "Overview"])
+            columns = LIDARR_ARTIST_COLUMNS
         else: # Sonarr/Radarr
-            self.table.setColumnCount(3)
-            self.table.setHorizontalHeaderLabels(["Title", "Year", "Overview"])
-            
-        self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SelectionMode.ExtendedSelection)
-        self.table.itemDoubleClicked.connect(self.on_double_click)
+            columns = ARR_COLUMNS
+        
+        self.model = ResultsModel(columns, self)
+        self.model.set_rows(results)
         
         # --- NEW: Enable Sorting (from Review) ---
-        self.table.setSortingEnabled(True)
+        # Sorting happens in a proxy so self.results keeps its original order
+        self.proxy_model = QSortFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.model)
         # --- END NEW ---
         
-        layout.addWidget(self.table)
+        self.table = make_results_table(self.proxy_model, QTableView.SelectionMode.ExtendedSelection)
+        self.table.setSortingEnabled(True)
+        self.table.doubleClicked.connect(self.on_double_click)
         
-        self.table.setRowCount(len(results))
-        for i, item in enumerate(results):
-            if service == "lidarr":
-                if search_type == "album":
-                    title = item.get("title", "Unknown")
-                    artist = item.get("artist", {}).get("artistName", "Unknown")
-                    year = str(item.get("releaseDate", "N/A"))[:4]
-                    self.table.setItem(i, 0, QTableWidgetItem(title))
-                    self.table.setItem(i, 1, QTableWidgetItem(artist))
-                    self.table.setItem(i, 2, QTableWidgetItem(year))
-                else: # artist
-                    title = item.get("artistName", "Unknown")
-                    year = item.get("disambiguation", "")
-                    overview = item.get("overview", "")[:100] + "..."
-                    self.table.setItem(i, 0, QTableWidgetItem(title))
-                    self.table.setItem(i, 1, QTableWidgetItem(year))
-                    self.table.setItem(i, 2, QTableWidgetItem(overview))
-            else:
-                title = item.get("title", "Unknown")
-                year = str(item.get("year", ""))
-                overview = item.get("overview", "")[:100] + "..."
-                self.table.setItem(i, 0, QTableWidgetItem(title))
-                self.table.setItem(i, 1, QTableWidgetItem(year))
-                self.table.setItem(i, 2, QTableWidgetItem(overview))
+        layout.addWidget(self.table)
         
         self.button_box = QDialogButtonBox()
         self.button_box.addButton("Select", QDialogButtonBox.ButtonRole.AcceptRole)
@@ -98,7 +184,10 @@ class SelectionDialog(QDialog):
         layout.addWidget(self.button_box)
     
     def validate_and_accept(self):
-        selected_rows = sorted(set(item.row() for item in self.table.selectedItems()))
+        selected_rows = sorted(
+            self.proxy_model.mapToSource(index).row()
+            for index in self.table.selectionModel().selectedRows()
+        )
         
         if not selected_rows:
             QMessageBox.warning(self, "No Selection", "Please select at least one item, or click Skip.")
@@ -107,8 +196,8 @@ class SelectionDialog(QDialog):
         self.selected_items = [self.results[row] for row in selected_rows]
         self.accept()
     
-    def on_double_click(self, item):
-        row = item.row()
+    def on_double_click(self, index: QModelIndex):
+        row = self.proxy_model.mapToSource(index).row()
         self.selected_items = [self.results[row]]
         self.accept()
     
@@ -132,7 +221,10 @@ class BlacklistWidget(QWidget):
         layout.addWidget(QLabel("<b>Blacklist</b> (one entry per line, '#' to comment)"))
         
         self.blacklist_edit = QTextEdit()
+        self.blacklist_edit.textChanged.connect(self._on_blacklist_edited)
         layout.addWidget(self.blacklist_edit)
+        self._cached_words: Optional[list[str]] = None  # Parsed active words, reset on edit
+        self._cached_patterns: Optional[list[re.Pattern]] = None  # Compiled words, reset on edit
         
         button_layout = QGridLayout()
         self.btn_save_settings = QPushButton("Save List")
@@ -157,12 +249,20 @@ class BlacklistWidget(QWidget):
     def _load_blacklist_from_settings(self):
         """Load the saved list from the global settings."""
         raw_list = self.settings.get_global_setting("identify_blacklist", "")
-        self.blacklist_edit.setText(raw_list)
+        self.blacklist_edit.setPlainText(raw_list)  # Never parsed as HTML, unlike setText()
+        # Reuse the list parsed at save time while the saved text is unchanged
+        if self.settings.get_global_setting("identify_blacklist_hash", "") == blacklist_digest(raw_list):
+            try:
+                self._cached_words = json.loads(self.settings.get_global_setting("identify_blacklist_parsed", ""))
+            except ValueError:
+                pass
 
     def _save_blacklist_to_settings(self):
         """Save the current list to global settings."""
         raw_list = self.blacklist_edit.toPlainText()
         self.settings.set_global_setting("identify_blacklist", raw_list)
+        self.settings.set_global_setting("identify_blacklist_hash", blacklist_digest(raw_list))
+        self.settings.set_global_setting("identify_blacklist_parsed", json.dumps(self.get_blacklist_words()))
         QMessageBox.information(self, "Blacklist Saved", "Your blacklist has been saved to settings.")
 
     def _load_blacklist_from_csv(self):
@@ -173,13 +273,16 @@ class BlacklistWidget(QWidget):
         
         words = parse_csv_to_list(file_path)
         if words:
-            # Append to existing text, ensuring no double newlines
-            current_text = self.blacklist_edit.toPlainText().strip()
-            new_text = "\n".join(words)
-            if current_text:
-                self.blacklist_edit.setText(current_text + "\n" + new_text)
-            else:
-                self.blacklist_edit.setText(new_text)
+            # Append at the end of the document in one edit, rather than
+            # copying the whole text out and setting it back
+            document = self.blacklist_edit.document()
+            cursor = QTextCursor(document)
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            cursor.beginEditBlock()
+            if not document.isEmpty() and document.characterAt(document.characterCount() - 2) != "\u2029":
+                cursor.insertText("\n")  # Start the import on its own line
+            cursor.insertText("\n".join(words))
+            cursor.endEditBlock()
             QMessageBox.information(self, "Import Complete", f"Imported and appended {len(words)} words from CSV.")
 
     def _save_blacklist_to_csv(self):
@@ -198,17 +301,22 @@ class BlacklistWidget(QWidget):
         """
         Get the current list of *active* (non-commented) words.
         This is our "enable/disable" feature.
+        The parsed list is cached until the text is edited.
         """
-        raw_list = self.blacklist_edit.toPlainText()
-        words = raw_list.split('\n')
-        
-        active_words = []
-        for w in words:
-            w_stripped = w.strip()
-            if w_stripped and not w_stripped.startswith("#"):
-                active_words.append(w_stripped)
-        
-        return active_words
+        if self._cached_words is None:
+            stripped = (w.strip() for w in self.blacklist_edit.toPlainText().split('\n'))
+            self._cached_words = [w for w in stripped if w and not w.startswith("#")]
+        return self._cached_words
+
+    def get_blacklist_patterns(self) -> list[re.Pattern]:
+        """The active words compiled for scrub_name, built once per edit of the text."""
+        if self._cached_patterns is None:
+            self._cached_patterns = compile_blacklist(self.get_blacklist_words())
+        return self._cached_patterns
+
+    def _on_blacklist_edited(self):
+        self._cached_words = None
+        self._cached_patterns = None
 
 
 # --- Identify Dialog ---
@@ -225,14 +333,14 @@ class IdentifyDialog(QDialog):
         
         self.api_client = api_client
         self.settings = settings
+        self._credentials = None  # (base_url, api_key), see _get_api_credentials
         
         self.item_id = item_id
         self.item_type = item_type
         self.search_results = []
         self.selected_result = None
         
-        self.api_thread = None
-        self.api_worker = None
+        self.api_worker = None  # Worker of the search in flight, if any
         self.is_initial_search = True # Flag for auto-scrubbing
         
         # --- Main Layout (Splitter) ---
@@ -261,13 +369,11 @@ class IdentifyDialog(QDialog):
         
         layout.addLayout(form_layout)
         
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["Title", "Year", "Provider", "Overview"])
-        self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        self.table.itemDoubleClicked.connect(self.on_ok)
+        self.model = ResultsModel(REMOTE_SEARCH_COLUMNS, self)
+        self.table = make_results_table(
+            self.model, QTableView.SelectionMode.SingleSelection, REMOTE_SEARCH_COLUMN_WIDTHS
+        )
+        self.table.doubleClicked.connect(self.on_ok)
         layout.addWidget(self.table)
         
         self.buttons = QDialogButtonBox(
@@ -278,7 +384,7 @@ class IdentifyDialog(QDialog):
         self.buttons.button(QDialogButtonBox.StandardButton.Ok).setEnabled(False)
         layout.addWidget(self.buttons)
         
-        self.table.itemSelectionChanged.connect(
+        self.table.selectionModel().selectionChanged.connect(
             lambda: self.buttons.button(QDialogButtonBox.StandardButton.Ok).setEnabled(True)
         )
         
@@ -292,12 +398,19 @@ class IdentifyDialog(QDialog):
         main_layout.addWidget(splitter)
         
         # Auto-search on open (will be scrubbed)
-        QTimer.singleShot(100, self.start_search)
+        QTimer.singleShot(0, self.start_search)
+
+    def _get_api_credentials(self):
+        """Read once per dialog, on the first search's worker; the dialog is modal, so settings can't change while it is open."""
+        if self._credentials is None:
+            base_url = self.settings.get_plugin_setting("jellyfin", "url")
+            api_key = self.settings.get_plugin_setting("jellyfin", "api_key")
+            self._credentials = (base_url, api_key)
+        return self._credentials
 
     def _task_remote_search(self, item_type: str, search_payload: Dict[str, Any]):
         """Worker task function."""
-        base_url = self.settings.get_plugin_setting("jellyfin", "url")
-        api_key = self.settings.get_plugin_setting("jellyfin", "api_key")
+        base_url, api_key = self._get_api_credentials()
         endpoint = f"{base_url}/Items/RemoteSearch/{item_type}"
         
         return self.api_client.api_request(
@@ -309,59 +422,39 @@ class IdentifyDialog(QDialog):
         )
 
     def start_search(self):
-        if self.api_thread is not None:
-            if self.api_worker: self.api_worker.stop()
-            self.api_thread.quit()
-            self.api_thread.wait(1000)
+        self._cancel_search()
 
         self.btn_search.setEnabled(False)
         self.btn_search.setText("Searching...")
-        self.table.clearContents()
-        self.table.setRowCount(0)
+        self.model.set_rows([])
         
         search_name = self.name_input.text().strip()
         search_year = self.year_input.text().strip()
         
         if self.is_initial_search:
             self.is_initial_search = False
-            blacklist = self.blacklist_widget.get_blacklist_words()
+            blacklist = self.blacklist_widget.get_blacklist_patterns()
             scrubbed_name = scrub_name(search_name, blacklist)
             
             if scrubbed_name != search_name:
                 self.name_input.setText(scrubbed_name)
                 search_name = scrubbed_name
         
+        search_info = {"Name": search_name}
+        if search_year.isdigit() and int(search_year):
+            search_info["Year"] = int(search_year)
         search_payload = {
-            "SearchInfo": {
-                "Name": search_name,
-                "Year": int(search_year) if search_year.isdigit() else None
-            },
+            "SearchInfo": search_info,
             "ItemId": self.item_id,
             "IncludeDisabledProviders": False
         }
         
-        if not search_payload["SearchInfo"]["Year"]:
-             del search_payload["SearchInfo"]["Year"]
-        
-        self.api_thread = QThread()
-        self.api_worker = ApiWorker(
-            self._task_remote_search,
-            item_type=self.item_type,
-            search_payload=search_payload
-        )
-        self.api_worker.moveToThread(self.api_thread)
-        
-        self.api_thread.started.connect(self.api_worker.run)
-        self.api_worker.finished.connect(self.on_search_finished)
-        
-        self.api_thread.start()
+        self._run_search(self.item_type, search_payload)
 
     def on_search_finished(self, result: Optional[List[Dict[str, Any]]], error: str):
-        if self.api_thread:
-            self.api_thread.quit()
-            self.api_thread.wait(1000)
-            self.api_thread = None
-            self.api_worker = None
+        if self.sender() is not self.api_worker:
+            return  # Late result from a search that was superseded
+        self.api_worker = None
         
         self.btn_search.setEnabled(True)
         self.btn_search.setText("Search")
@@ -372,17 +465,7 @@ class IdentifyDialog(QDialog):
             return
             
         self.search_results = result
-        self.table.setRowCount(len(self.search_results))
-        
-        for i, item in enumerate(self.search_results):
-            self.table.setItem(i, 0, QTableWidgetItem(item.get("Name", "N/A")))
-            self.table.setItem(i, 1, QTableWidgetItem(str(item.get("ProductionYear", "N/A"))))
-            provider_ids = item.get("ProviderIds", {})
-            provider_str = ", ".join(f"{k}: {v}" for k, v in provider_ids.items() if v)
-            self.table.setItem(i, 2, QTableWidgetItem(provider_str))
-            self.table.setItem(i, 3, QTableWidgetItem(item.get("Overview", "")[:100] + "..."))
-            
-        self.table.resizeColumnsToContents()
+        self.model.set_rows(self.search_results)
 
     def on_ok(self):
         selected_rows = self.table.selectionModel().selectedRows()
@@ -398,12 +481,26 @@ class IdentifyDialog(QDialog):
         return self.selected_result
         
     def closeEvent(self, event):
-        if self.api_thread is not None:
-            if self.api_worker: self.api_worker.stop()
-            self.api_thread.quit()
-            self.api_thread.wait(1000)
+        self._cancel_search()
         event.accept()
 
+    def _run_search(self, item_type: str, search_payload: Dict[str, Any]):
+        """Runs one remote search on the shared thread pool."""
+        runnable = ApiRunnable(
+            self._task_remote_search,
+            item_type=item_type,
+            search_payload=search_payload
+        )
+        self.api_worker = runnable.worker
+        self.api_worker.finished.connect(self.on_search_finished)
+        QThreadPool.globalInstance().start(runnable)
+
+    def _cancel_search(self):
+        """Drops the result of the search in flight (the HTTP call itself finishes in the background)."""
+        if self.api_worker is not None:
+            self.api_worker.stop()
+            self.api_worker = None
+
 
 # --- Bulk Identify Dialog (Updated) ---
 class BulkIdentifyDialog(QDialog):
@@ -421,14 +518,15 @@ class BulkIdentifyDialog(QDialog):
         
         self.api_client = api_client
         self.settings = settings
+        self._credentials = None  # (base_url, api_key), see _get_api_credentials
         
         self.items_list = items_list
         self.current_item_index = -1
         self.current_item_data = None
         self.search_results = []
+        self._scrubbed_names: Dict[int, str] = {}  # Item index -> scrubbed search name
         
-        self.api_thread = None
-        self.api_worker = None
+        self.api_worker = None  # Worker of the search in flight, if any
         
         # --- Main Layout (Splitter) ---
         main_layout = QHBoxLayout(self)
@@ -463,15 +561,13 @@ class BulkIdentifyDialog(QDialog):
         
         layout.addLayout(form_layout)
         
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["Title", "Year", "Provider", "Overview"])
-        self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        self.model = ResultsModel(REMOTE_SEARCH_COLUMNS, self)
+        self.table = make_results_table(
+            self.model, QTableView.SelectionMode.SingleSelection, REMOTE_SEARCH_COLUMN_WIDTHS
+        )
         layout.addWidget(self.table)
         
-        self.table.itemDoubleClicked.connect(self.on_apply_next)
+        self.table.doubleClicked.connect(self.on_apply_next)
         
         button_layout = QHBoxLayout()
         self.btn_apply_next = QPushButton("Apply & Next")
@@ -488,7 +584,7 @@ class BulkIdentifyDialog(QDialog):
         button_layout.addWidget(self.btn_cancel)
         layout.addLayout(button_layout)
         
-        self.table.itemSelectionChanged.connect(
+        self.table.selectionModel().selectionChanged.connect(
             lambda: self.btn_apply_next.setEnabled(True)
         )
         
@@ -496,13 +592,15 @@ class BulkIdentifyDialog(QDialog):
         
         # --- Right Panel (Blacklist) ---
         self.blacklist_widget = BlacklistWidget(self.settings)
+        self.blacklist_widget.blacklist_edit.textChanged.connect(self._scrubbed_names.clear)
         splitter.addWidget(self.blacklist_widget)
 
         splitter.setSizes([600, 300]) # Set initial sizes
         main_layout.addWidget(splitter)
         
+        QTimer.singleShot(0, self._prescrub_names)
         # Load the first item
-        QTimer.singleShot(100, self.load_next_item)
+        QTimer.singleShot(0, self.load_next_item)
 
     def load_next_item(self):
         """
@@ -522,8 +620,10 @@ class BulkIdentifyDialog(QDialog):
         item_path = self.current_item_data.get("Path", "N/A")
         item_year = str(self.current_item_data.get("ProductionYear", ""))
 
-        blacklist = self.blacklist_widget.get_blacklist_words()
-        scrubbed_name = scrub_name(item_name, blacklist)
+        scrubbed_name = self._scrubbed_names.get(self.current_item_index)
+        if scrubbed_name is None:
+            blacklist = self.blacklist_widget.get_blacklist_patterns()
+            scrubbed_name = scrub_name(item_name, blacklist)
 
         self.item_label.setText(item_name) # Show original name in label
         self.path_label.setText(f"<b>Path:</b> {item_path}")
@@ -534,10 +634,32 @@ class BulkIdentifyDialog(QDialog):
         
         self.start_search(is_auto_search=True)
 
+    def _prescrub_names(self):
+        """Scrubs every item's name on the thread pool once the dialog is up, so moving on to the next item doesn't."""
+        blacklist = self.blacklist_widget.get_blacklist_patterns()
+        names = [item.get("Name") or "" for item in self.items_list]
+        runnable = ApiRunnable(scrub_names, names, blacklist)
+        runnable.worker.finished.connect(
+            lambda result, error: self._on_names_prescrubbed(result, blacklist)
+        )
+        QThreadPool.globalInstance().start(runnable)
+
+    def _on_names_prescrubbed(self, result: Optional[List[str]], blacklist: List[re.Pattern]):
+        # A blacklist edit while scrubbing replaces the compiled list; drop the stale names then
+        if result is not None and blacklist is self.blacklist_widget.get_blacklist_patterns():
+            self._scrubbed_names.update(enumerate(result))
+
+    def _get_api_credentials(self):
+        """Read once per dialog, on the first search's worker; the dialog is modal, so settings can't change while it is open."""
+        if self._credentials is None:
+            base_url = self.settings.get_plugin_setting("jellyfin", "url")
+            api_key = self.settings.get_plugin_setting("jellyfin", "api_key")
+            self._credentials = (base_url, api_key)
+        return self._credentials
+
     def _task_remote_search(self, item_type: str, search_payload: Dict[str, Any]):
         """Worker task function."""
-        base_url = self.settings.get_plugin_setting("jellyfin", "url")
-        api_key = self.settings.get_plugin_setting("jellyfin", "api_key")
+        base_url, api_key = self._get_api_credentials()
         endpoint = f"{base_url}/Items/RemoteSearch/{item_type}"
         
         return self.api_client.api_request(
@@ -552,15 +674,11 @@ class BulkIdentifyDialog(QDialog):
         if not self.current_item_data:
             return
 
-        if self.api_thread is not None:
-            if self.api_worker: self.api_worker.stop()
-            self.api_thread.quit()
-            self.api_thread.wait(1000)
+        self._cancel_search()
         
         self.btn_search.setEnabled(False)
         self.btn_search.setText("Searching...")
-        self.table.clearContents()
-        self.table.setRowCount(0)
+        self.model.set_rows([])
         
         search_name = self.name_input.text().strip()
         search_year = self.year_input.text().strip()
@@ -568,42 +686,27 @@ class BulkIdentifyDialog(QDialog):
         item_type = self.current_item_data.get("Type")
 
         if not is_auto_search:
-            blacklist = self.blacklist_widget.get_blacklist_words()
+            blacklist = self.blacklist_widget.get_blacklist_patterns()
             scrubbed_name = scrub_name(search_name, blacklist)
-            self.name_input.setText(scrubbed_name)
-            search_name = scrubbed_name
+            if scrubbed_name != search_name:
+                self.name_input.setText(scrubbed_name)
+                search_name = scrubbed_name
 
+        search_info = {"Name": search_name}
+        if search_year.isdigit() and int(search_year):
+            search_info["Year"] = int(search_year)
         search_payload = {
-            "SearchInfo": {
-                "Name": search_name,
-                "Year": int(search_year) if search_year.isdigit() else None
-            },
+            "SearchInfo": search_info,
             "ItemId": item_id,
             "IncludeDisabledProviders": False
         }
         
-        if not search_payload["SearchInfo"]["Year"]:
-             del search_payload["SearchInfo"]["Year"]
-        
-        self.api_thread = QThread()
-        self.api_worker = ApiWorker(
-            self._task_remote_search,
-            item_type=item_type,
-            search_payload=search_payload
-        )
-        self.api_worker.moveToThread(self.api_thread)
-        
-        self.api_thread.started.connect(self.api_worker.run)
-        self.api_worker.finished.connect(self.on_search_finished)
-        
-        self.api_thread.start()
+        self._run_search(item_type, search_payload)
 
     def on_search_finished(self, result: Optional[List[Dict[str, Any]]], error: str):
-        if self.api_thread:
-            self.api_thread.quit()
-            self.api_thread.wait(1000)
-            self.api_thread = None
-            self.api_worker = None
+        if self.sender() is not self.api_worker:
+            return  # Late result from a search that was superseded
+        self.api_worker = None
         
         self.btn_search.setEnabled(True)
         self.btn_search.setText("Search")
@@ -614,17 +717,7 @@ class BulkIdentifyDialog(QDialog):
             return
             
         self.search_results = result
-        self.table.setRowCount(len(self.search_results))
-        
-        for i, item in enumerate(self.search_results):
-            self.table.setItem(i, 0, QTableWidgetItem(item.get("Name", "N/A")))
-            self.table.setItem(i, 1, QTableWidgetItem(str(item.get("ProductionYear", "N/A"))))
-            provider_ids = item.get("ProviderIds", {})
-            provider_str = ", ".join(f"{k}: {v}" for k, v in provider_ids.items() if v)
-            self.table.setItem(i, 2, QTableWidgetItem(provider_str))
-            self.table.setItem(i, 3, QTableWidgetItem(item.get("Overview", "")[:100] + "..."))
-            
-        self.table.resizeColumnsToContents()
+        self.model.set_rows(self.search_results)
 
     def on_apply_next(self):
         selected_rows = self.table.selectionModel().selectedRows()
@@ -644,10 +737,22 @@ class BulkIdentifyDialog(QDialog):
             logger.error("Could not apply, item_id or selected_result is missing.")
 
     def closeEvent(self, event):
-        if self.api_thread is not None:
-            if self.api_worker: self.api_worker.stop()
-            self.api_thread.quit()
-            # --- THIS IS THE FIX ---
-            self.api_thread.wait(1000) # Changed 1Player to 1000
-            # --- END FIX ---
-        event.accept()
\ No newline at end of file
+        self._cancel_search()
+        event.accept()
+
+    def _run_search(self, item_type: str, search_payload: Dict[str, Any]):
+        """Runs one remote search on the shared thread pool."""
+        runnable = ApiRunnable(
+            self._task_remote_search,
+            item_type=item_type,
+            search_payload=search_payload
+        )
+        self.api_worker = runnable.worker
+        self.api_worker.finished.connect(self.on_search_finished)
+        QThreadPool.globalInstance().start(runnable)
+
+    def _cancel_search(self):
+        """Drops the result of the search in flight (the HTTP call itself finishes in the background)."""
+        if self.api_worker is not None:
+            self.api_worker.stop()
+            self.api_worker = None
\ No newline at end of file
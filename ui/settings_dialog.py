@@ -3,16 +3,20 @@
 Settings dialog for configuring all service URLs and API keys.
 Now uses SecureStorage (keyring) for API keys and manages volumes.
 """
+import hashlib
+import json
 import logging
+import time
+from typing import Callable, Optional
 from PyQt6.QtWidgets import (
     QDialog, QLineEdit, QFormLayout, QDialogButtonBox,
     QLabel, QCheckBox, QWidget, QVBoxLayout, QPushButton,
     QHBoxLayout, QMessageBox, QTableWidget, QTableWidgetItem,
-    QComboBox, QAbstractItemView
+    QComboBox, QAbstractItemView, QTabWidget
 )
-from PyQt6.QtCore import QSettings, QThread, Qt
+from PyQt6.QtCore import QSettings, QThreadPool, Qt
 from core.settings_manager import APP_ORGANIZATION, APP_NAME
-from core.api_client import ApiClient, ApiWorker
+from core.api_client import ApiClient, ApiRunnable
 from core.secure_storage import SecureStorage
 
 try:
@@ -22,6 +26,49 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# (service name, section header, API version used by its connection test)
+SERVICES = (
+    ("prowlarr", "Prowlarr (Optional - Enhanced Search)", "v1"),
+    ("jellyfin", "Jellyfin", "v1"),
+    ("sonarr", "Sonarr (TV Shows)", "v3"),
+    ("radarr", "Radarr (Movies)", "v3"),
+    ("lidarr", "Lidarr (Music)", "v1"),
+    ("readarr", "Readarr (Books)", "v1"),
+    ("bazarr", "Bazarr (Subtitles)", "v1"),
+)
+
+# Connection-test (endpoint template, version field) for services that differ from the *arr API
+TEST_ENDPOINTS = {
+    "jellyfin": ("{url}/System/Info", "Version"),
+    "bazarr": ("{url}/api/status", "bazarr_version"),
+}
+DEFAULT_TEST_ENDPOINT = ("{url}/api/{api_version}/system/status", "version")
+TEST_RESULT_TTL = 30  # Seconds a successful connection test is reused for the same URL and key
+
+
+def _key_digest(api_key: str) -> str:
+    """SHA-256 of an API key, so the dialog can compare keys without holding saved ones."""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+
+def _section_label(text: str) -> QLabel:
+    """A plain-text section header, bolded by SettingsDialog's stylesheet rather than <b> markup."""
+    label = QLabel(text)
+    label.setTextFormat(Qt.TextFormat.PlainText)
+    label.setProperty("section", True)
+    return label
+
+
+def _ok_cancel_buttons(dialog: QDialog, on_accept: Callable) -> QDialogButtonBox:
+    """The OK/Cancel row shared by this module's dialogs; Cancel rejects `dialog`."""
+    buttons = QDialogButtonBox(
+        QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel, dialog
+    )
+    buttons.accepted.connect(on_accept)
+    buttons.rejected.connect(dialog.reject)
+    return buttons
+
+
 class SettingsDialog(QDialog):
     """
     Settings dialog for configuring all service URLs and API keys.
@@ -30,182 +77,237 @@ class SettingsDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Settings")
         self.setModal(True)
-        self.resize(500, 750)
+        self.resize(500, 450)
         
         self.api_client = api_client
         self.secure_storage = secure_storage
         
         self.settings = QSettings(APP_ORGANIZATION, APP_NAME)
-        self.test_thread = None
-        self.test_worker = None
+        self.setStyleSheet('QLabel[section="true"] { font-weight: bold; }')
+        self._url_inputs = {}  # service name -> URL QLineEdit
+        self._api_inputs = {}  # service name -> API key QLineEdit
+        self._test_buttons = {}  # service name -> its Test button
+        self._running_tests = {}  # test worker -> (service name, Test All batch or None)
+        # Connection tests get their own pool, one thread per service, so Test All
+        # waits only as long as the slowest test and never queues behind other work
+        self._test_pool = QThreadPool(self)
+        self._test_pool.setMaxThreadCount(len(SERVICES))
+        self._test_results = {}  # (service, url, api version, key digest) -> (time, successful result)
+        self._loaded_values = {}  # QSettings key -> value the dialog was opened with
+        self._saved_key_digests = {}  # service name -> SHA-256 of its saved API key
+        self._persisters = {}  # field key -> callable that saves that field
+        self._dirty_fields = set()  # field keys edited since the dialog opened
+        self._volume_manager = None  # Built on first open, then reused
         
         layout = QFormLayout(self)
         
-        # --- Prowlarr ---
-        layout.addRow(QLabel("<b>Prowlarr (Optional - Enhanced Search)</b>"))
-        self.prowlarr_enabled = QCheckBox("Enable Prowlarr for searches")
-        self.prowlarr_enabled.setChecked(self.settings.value("prowlarr/enabled", False, type=bool))
-        layout.addRow(self.prowlarr_enabled)
-        
-        self.prowlarr_url = QLineEdit(self.settings.value("prowlarr/url", ""))
-        layout.addRow("URL:", self.prowlarr_url)
-        self.prowlarr_api = self._create_api_key_input("prowlarr")
-        layout.addRow("API Key:", self.prowlarr_api)
-        layout.addRow(self._create_test_button("prowlarr", "v1"))
-
-        # --- Jellyfin ---
-        layout.addRow(QLabel("<b>Jellyfin</b>"))
-        self.jellyfin_url = QLineEdit(self.settings.value("jellyfin/url", ""))
-        layout.addRow("URL:", self.jellyfin_url)
-        self.jellyfin_api = self._create_api_key_input("jellyfin")
-        layout.addRow("API Key:", self.jellyfin_api)
-        layout.addRow(self._create_test_button("jellyfin", "v1"))
-        
-        # --- Sonarr ---
-        layout.addRow(QLabel("<b>Sonarr (TV Shows)</b>"))
-        self.sonarr_url = QLineEdit(self.settings.value("sonarr/url", ""))
-        layout.addRow("URL:", self.sonarr_url)
-        self.sonarr_api = self._create_api_key_input("sonarr")
-        layout.addRow("API Key:", self.sonarr_api)
-        layout.addRow(self._create_test_button("sonarr", "v3"))
-
-        # --- Radarr ---
-        layout.addRow(QLabel("<b>Radarr (Movies)</b>"))
-        self.radarr_url = QLineEdit(self.settings.value("radarr/url", ""))
-        layout.addRow("URL:", self.radarr_url)
-        self.radarr_api = self._create_api_key_input("radarr")
-        layout.addRow("API Key:", self.radarr_api)
-        layout.addRow(self._create_test_button("radarr", "v3"))
-
-        # --- Lidarr ---
-        layout.addRow(QLabel("<b>Lidarr (Music)</b>"))
-        self.lidarr_url = QLineEdit(self.settings.value("lidarr/url", ""))
-        layout.addRow("URL:", self.lidarr_url)
-        self.lidarr_api = self._create_api_key_input("lidarr")
-        layout.addRow("API Key:", self.lidarr_api)
-        layout.addRow(self._create_test_button("lidarr", "v1"))
-
-        # --- Readarr ---
-        layout.addRow(QLabel("<b>Readarr (Books)</b>"))
-        self.readarr_url = QLineEdit(self.settings.value("readarr/url", ""))
-        layout.addRow("URL:", self.readarr_url)
-        self.readarr_api = self._create_api_key_input("readarr")
-        layout.addRow("API Key:", self.readarr_api)
-        layout.addRow(self._create_test_button("readarr", "v1"))
-
-        # --- Bazarr ---
-        layout.addRow(QLabel("<b>Bazarr (Subtitles)</b>"))
-        self.bazarr_url = QLineEdit(self.settings.value("bazarr/url", ""))
-        layout.addRow("URL:", self.bazarr_url)
-        self.bazarr_api = self._create_api_key_input("bazarr")
-        layout.addRow("API Key:", self.bazarr_api)
-        layout.addRow(self._create_test_button("bazarr", "v1"))
+        # One tab per service; a tab's widgets are only built the first time it is shown
+        self.service_tabs = QTabWidget()
+        for service, _label, _api_version in SERVICES:
+            self.service_tabs.addTab(QWidget(), service.title())
+        self._built_tabs = set()
+        self.service_tabs.currentChanged.connect(self._build_service_tab)
+        self._build_service_tab(self.service_tabs.currentIndex())
+        layout.addRow(self.service_tabs)
+
+        self.btn_test_all = QPushButton("Test All Services")
+        self.btn_test_all.clicked.connect(self._test_all_services)
+        layout.addRow(self.btn_test_all)
         
         # --- File System ---
-        layout.addRow(QLabel("<b>File System Volumes</b>"))
+        layout.addRow(_section_label("File System Volumes"))
         self.btn_manage_volumes = QPushButton("Manage Network Volumes...")
         self.btn_manage_volumes.clicked.connect(self.open_volume_manager)
         layout.addRow(self.btn_manage_volumes)
 
         # --- Buttons ---
-        buttons = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
-        )
-        buttons.accepted.connect(self.save_settings)
-        buttons.rejected.connect(self.reject)
-        layout.addRow(buttons)
+        layout.addRow(_ok_cancel_buttons(self, self.save_settings))
+
+    def _build_service_tab(self, index: int):
+        """Fills a service's tab the first time it is shown, and probes only that service's saved key."""
+        if index < 0 or index in self._built_tabs:
+            return
+        self._built_tabs.add(index)
+        service, label, api_version = SERVICES[index]
+
+        form = QFormLayout(self.service_tabs.widget(index))
+        form.addRow(_section_label(label))
+        if service == "prowlarr":
+            self.prowlarr_enabled = QCheckBox("Enable Prowlarr for searches")
+            self.prowlarr_enabled.setChecked(self._load_setting("prowlarr/enabled", False, bool))
+            form.addRow(self.prowlarr_enabled)
+            self._track_field("prowlarr/enabled", self.prowlarr_enabled.toggled,
+                lambda: self._save_setting_if_changed("prowlarr/enabled", self.prowlarr_enabled.isChecked()))
+
+        url_key = f"{service}/url"
+        url_input = QLineEdit(self._load_setting(url_key, ""))
+        self._url_inputs[service] = url_input
+        form.addRow("URL:", url_input)
+        self._track_field(url_key, url_input.textChanged,
+            lambda: self._save_setting_if_changed(url_key, url_input.text().strip()))
+
+        api_input = self._create_api_key_input(service)
+        form.addRow("API Key:", api_input)
+        self._track_field(f"{service}_api_key", api_input.textChanged,
+            lambda: self._save_api_key_if_entered(service, api_input))
+        form.addRow(self._create_test_button(service, api_version))
+        if self._is_testing(service):  # Started by Test All before the tab existed
+            self._set_test_button_busy(service, True)
+
+        self._probe_saved_api_keys([service])
+
+    def _track_field(self, key: str, changed_signal, persist: Callable):
+        """Registers how to save a field; save_settings only calls it once `changed_signal` has fired."""
+        self._persisters[key] = persist
+        changed_signal.connect(lambda *_: self._dirty_fields.add(key))
+
+    def _load_setting(self, key: str, default, value_type=str):
+        """Reads a setting and remembers it, so save_settings can skip unchanged values."""
+        value = self.settings.value(key, default, type=value_type)
+        self._loaded_values[key] = value
+        return value
+
+    def _save_setting_if_changed(self, key: str, value):
+        """Writes a setting only if it differs from what the dialog was opened with."""
+        if self._loaded_values.get(key) != value:
+            self.settings.setValue(key, value)
     
     def _create_api_key_input(self, service_name: str) -> QLineEdit:
-        """Checks keyring and returns a pre-filled line edit."""
+        """Returns an API key line edit; _probe_saved_api_keys marks it if a key is saved."""
         line_edit = QLineEdit()
-        if self.secure_storage.get_credential(f"{service_name}_api_key"):
-            line_edit.setPlaceholderText("[Saved in secure storage]")
-        else:
-            line_edit.setPlaceholderText(f"Enter {service_name.title()} API key...")
+        line_edit.setPlaceholderText(f"Enter {service_name.title()} API key...")
         line_edit.setEchoMode(QLineEdit.EchoMode.Password)
+        self._api_inputs[service_name] = line_edit
         return line_edit
 
+    def _probe_saved_api_keys(self, services: list):
+        """Checks the keyring for the services' API keys on the thread pool, so a slow backend can't stall the dialog."""
+        runnable = ApiRunnable(self._task_probe_api_keys, services=services)
+        runnable.worker.finished.connect(self._on_api_keys_probed)
+        QThreadPool.globalInstance().start(runnable)
+
+    def _task_probe_api_keys(self, services: list) -> dict:
+        """Worker task: digests of the API keys saved for each service that has one."""
+        digests = {}
+        for service_name in services:
+            api_key = self.secure_storage.get_credential(f"{service_name}_api_key")
+            if api_key:
+                digests[service_name] = _key_digest(api_key)
+        return digests
+
+    def _on_api_keys_probed(self, saved_key_digests: dict, error: str):
+        if error:
+            return
+        self._saved_key_digests.update(saved_key_digests)
+        for service_name in saved_key_digests:
+            self._api_inputs[service_name].setPlaceholderText("[Saved in secure storage]")
+
     def _create_test_button(self, service_name: str, api_version: str) -> QWidget:
         """Helper to create a "Test" button for a service."""
         widget = QWidget()
         layout = QHBoxLayout(widget)
         layout.setContentsMargins(0, 0, 0, 0)
         button = QPushButton(f"Test {service_name.title()}")
-        button.clicked.connect(lambda: self._test_service(service_name, api_version, button))
+        button.clicked.connect(lambda: self._test_service(service_name, api_version))
+        self._test_buttons[service_name] = button
         layout.addStretch()
         layout.addWidget(button)
         return widget
 
-    def _test_service(self, service: str, api_version: str, button: QPushButton):
-        """Runs the API test in a worker thread."""
-        if self.test_thread is not None:
-            QMessageBox.warning(self, "Test in Progress", "Another test is already running. Please wait.")
-            return
-
-        url_widget = getattr(self, f"{service}_url")
-        api_widget = getattr(self, f"{service}_api")
-        url = url_widget.text().strip().rstrip('/')
+    def _connection_details(self, service: str) -> tuple:
+        """The (url, api_key) to test a service with; saved values stand in for unbuilt tabs and untyped keys."""
+        url_input = self._url_inputs.get(service)
+        url = url_input.text() if url_input else self.settings.value(f"{service}/url", "", type=str)
+        url = url.strip().rstrip('/')
         
-        api_key = api_widget.text().strip()
+        api_input = self._api_inputs.get(service)
+        api_key = api_input.text().strip() if api_input else ""
         if not api_key or api_key == "[Saved in secure storage]":
             api_key = self.secure_storage.get_credential(f"{service}_api_key")
+        return url, api_key
+
+    def _is_testing(self, service: str) -> bool:
+        return any(running == service for running, _batch in self._running_tests.values())
+
+    def _set_test_button_busy(self, service: str, busy: bool):
+        """Disables a service's Test button while it runs; the tab may not be built yet."""
+        button = self._test_buttons.get(service)
+        if button is not None:
+            button.setEnabled(not busy)
+            button.setText("Testing..." if busy else f"Test {service.title()}")
 
+    def _test_service(self, service: str, api_version: str):
+        """Runs the API test on the thread pool; different services can be tested at once."""
+        url, api_key = self._connection_details(service)
         if not url or not api_key:
             QMessageBox.warning(self, "Missing Info", f"Please enter a URL and API key for {service.title()} to test.")
             return
+        self._start_test(service, api_version, url, api_key)
+
+    def _test_all_services(self):
+        """Tests every configured service in parallel and reports them in one summary."""
+        batch = {"pending": set(), "results": {}}
+        for service, _label, api_version in SERVICES:
+            if self._is_testing(service):
+                continue  # Already being tested on its own
+            url, api_key = self._connection_details(service)
+            if url and api_key:
+                batch["pending"].add(service)
+                self._start_test(service, api_version, url, api_key, batch)
+
+        if not batch["pending"]:
+            QMessageBox.information(self, "Test All Services", "Enter a URL and API key for at least one service to test.")
+            return
+        self.btn_test_all.setEnabled(False)
+        self.btn_test_all.setText("Testing...")
 
-        button.setEnabled(False)
-        button.setText("Testing...")
+    def _start_test(self, service: str, api_version: str, url: str, api_key: str,
+                    batch: Optional[dict] = None):
+        """Starts one connection test; `batch` collects the result for Test All."""
+        self._set_test_button_busy(service, True)
 
-        self.test_thread = QThread()
-        self.test_worker = ApiWorker(
+        runnable = ApiRunnable(
             self._task_test_api,
             service=service,
             api_version=api_version,
             url=url,
             api_key=api_key
         )
-        self.test_worker.moveToThread(self.test_thread)
-        
-        self.test_worker.finished.connect(lambda result, error: self._on_test_finished(button, result, error))
-        self.test_worker.finished.connect(self.test_thread.quit)
-        self.test_worker.finished.connect(self.test_worker.deleteLater)
-        self.test_thread.finished.connect(self.test_thread.deleteLater)
-        self.test_thread.finished.connect(self._clear_test_thread)
-
-        self.test_thread.started.connect(self.test_worker.run)
-        self.test_thread.start()
+        self._running_tests[runnable.worker] = (service, batch)
+        runnable.worker.finished.connect(self._on_test_finished)
+        self._test_pool.start(runnable)
 
     def _task_test_api(self, service: str, api_version: str, url: str, api_key: str) -> dict:
-        """Worker task to test a service connection."""
-        if service == 'jellyfin':
-            endpoint = f"{url}/System/Info"
-        elif service == 'bazarr':
-            endpoint = f"{url}/api/status"
-        else:
-            endpoint = f"{url}/api/{api_version}/system/status"
-        
+        """Worker task to test a service connection; a recent success with the same details is reused."""
+        cache_key = (service, url, api_version, _key_digest(api_key))
+        cached = self._test_results.get(cache_key)
+        if cached and time.monotonic() - cached[0] < TEST_RESULT_TTL:
+            return cached[1]
+
+        template, version_key = TEST_ENDPOINTS.get(service, DEFAULT_TEST_ENDPOINT)
         response = self.api_client.api_request(
-            url=endpoint,
+            url=template.format(url=url, api_version=api_version),
             api_key=api_key,
             service_name=service,
             timeout=5
         )
-        
-        if service == 'jellyfin':
-            return {"service": service, "version": response.get("Version", "Unknown")}
-        elif service == 'bazarr':
-            return {"service": service, "version": response.get("bazarr_version", "Unknown")}
-        else:
-            return {"service": service, "version": response.get("version", "Unknown")}
+        result = {"service": service, "version": response.get(version_key, "Unknown")}
+        self._test_results[cache_key] = (time.monotonic(), result)
+        return result
 
-    def _on_test_finished(self, button: QPushButton, result: dict, error: str):
+    def _on_test_finished(self, result: dict, error: str):
         """Handles the result of the connection test."""
-        service_name = button.text().replace("Testing...", "").replace("Test ", "").strip()
-        button.setEnabled(True)
-        button.setText(f"Test {service_name}")
-
-        if error:
+        service, batch = self._running_tests.pop(self.sender())
+        self._set_test_button_busy(service, False)
+
+        if batch is not None:
+            if error:
+                logger.error(f"Test connection to {service} failed: {error}")
+            batch["results"][service] = f"Failed: {error}" if error else f"OK (version {result['version']})"
+            batch["pending"].discard(service)
+            if not batch["pending"]:
+                self._show_test_all_results(batch["results"])
+        elif error:
             logger.error(f"Test connection failed: {error}")
             QMessageBox.critical(self, "Test Failed", f"Connection failed:\n{error}")
         else:
@@ -214,50 +316,49 @@ class SettingsDialog(QDialog):
                 f"Version: {result['version']}"
             )
     
-    def _clear_test_thread(self):
-        """Clear thread references."""
-        self.test_thread = None
-        self.test_worker = None
-        
+    def _show_test_all_results(self, results: dict):
+        """Shows a Test All batch's results in SERVICES order."""
+        self.btn_test_all.setEnabled(True)
+        self.btn_test_all.setText("Test All Services")
+        lines = [f"{service.title()}: {results[service]}" for service, _label, _ver in SERVICES if service in results]
+        QMessageBox.information(self, "Test All Services", "\n".join(lines))
+    
     def open_volume_manager(self):
         """Opens the dialog to manage file system volumes."""
-        dialog = VolumeManagerDialog(self.secure_storage, self)
-        dialog.exec()
+        # Reopening keeps the same dialog; its volume list is the only writer
+        # of the saved volumes, so its table is already current
+        if self._volume_manager is None:
+            self._volume_manager = VolumeManagerDialog(self.secure_storage, self)
+        self._volume_manager.exec()
 
     def save_settings(self):
         """
         Save all settings to QSettings and SecureStorage.
         """
-        # Save non-sensitive settings
-        self.settings.setValue("prowlarr/enabled", self.prowlarr_enabled.isChecked())
-        self.settings.setValue("prowlarr/url", self.prowlarr_url.text().strip())
-        self.settings.setValue("jellyfin/url", self.jellyfin_url.text().strip())
-        self.settings.setValue("sonarr/url", self.sonarr_url.text().strip())
-        self.settings.setValue("radarr/url", self.radarr_url.text().strip())
-        self.settings.setValue("lidarr/url", self.lidarr_url.text().strip())
-        self.settings.setValue("readarr/url", self.readarr_url.text().strip())
-        self.settings.setValue("bazarr/url", self.bazarr_url.text().strip())
-        
-        # Save API keys to secure storage
-        self._save_api_key_if_entered("prowlarr", self.prowlarr_api)
-        self._save_api_key_if_entered("jellyfin", self.jellyfin_api)
-        self._save_api_key_if_entered("sonarr", self.sonarr_api)
-        self._save_api_key_if_entered("radarr", self.radarr_api)
-        self._save_api_key_if_entered("lidarr", self.lidarr_api)
-        self._save_api_key_if_entered("readarr", self.readarr_api)
-        self._save_api_key_if_entered("bazarr", self.bazarr_api)
+        # Only fields edited since opening are visited; the URL and key savers still
+        # skip values that were edited back to what is stored
+        for key in self._dirty_fields:
+            self._persisters[key]()
         
         self.accept()
         
     def _save_api_key_if_entered(self, service_name: str, line_edit: QLineEdit):
-        """Helper to save API key only if user entered new text."""
+        """Helper to save API key only if user entered a key that differs from the saved one."""
         api_key = line_edit.text().strip()
-        if api_key and api_key != "[Saved in secure storage]":
-            self.secure_storage.set_credential(f"{service_name}_api_key", api_key)
+        if not api_key or api_key == "[Saved in secure storage]":
+            return
+        if self._saved_key_digests.get(service_name) == _key_digest(api_key):
+            return  # Re-entered the saved key; skip the keyring write
+        self.secure_storage.set_credential(f"{service_name}_api_key", api_key)
 
 
 # --- Volume Manager Dialogs (New) ---
 
+# Volumes are stored as one JSON string; QSettings would otherwise encode every
+# field of every volume dict separately. The old key is migrated on first read.
+VOLUMES_KEY = "filesystem_volumes_json"
+LEGACY_VOLUMES_KEY = "filesystem_volumes"
+
 class VolumeManagerDialog(QDialog):
     """A dialog to add, edit, and remove network volumes."""
     
@@ -267,6 +368,12 @@ class VolumeManagerDialog(QDialog):
         self.resize(700, 400)
         self.secure_storage = secure_storage
         self.settings = QSettings(APP_ORGANIZATION, APP_NAME)
+        # Working copy of the saved volumes; edits change it and write it back once
+        self._volumes = self._read_volumes()
+        # Keyring writes run here, off the GUI thread; one thread keeps them in order
+        self._keyring_pool = QThreadPool(self)
+        self._keyring_pool.setMaxThreadCount(1)
+        self._edit_dialog = None  # Add/Edit form, built on first use
         
         layout = QVBoxLayout(self)
         
@@ -303,25 +410,31 @@ class VolumeManagerDialog(QDialog):
         self.load_volumes()
 
     def load_volumes(self):
-        """Load volumes from QSettings (excluding passwords)."""
-        volumes = self.settings.value("filesystem_volumes", [])
-        self.table.setRowCount(len(volumes))
-        for i, volume in enumerate(volumes):
-            self.table.setItem(i, 0, QTableWidgetItem(volume.get("name")))
-            self.table.setItem(i, 1, QTableWidgetItem(volume.get("type")))
-            self.table.setItem(i, 2, QTableWidgetItem(volume.get("host")))
-            self.table.setItem(i, 3, QTableWidgetItem(volume.get("path_prefix")))
-            self.table.setItem(i, 4, QTableWidgetItem(volume.get("remote_path")))
-            self.table.item(i, 0).setData(Qt.ItemDataRole.UserRole, volume)
+        """Show the volumes (passwords live in the keyring, not here)."""
+        volumes = self._volumes
+        # Fill without per-item signals and repaints; the table redraws once at the end
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
+        try:
+            self.table.setRowCount(len(volumes))
+            for i, volume in enumerate(volumes):
+                self.table.setItem(i, 0, QTableWidgetItem(volume.get("name")))
+                self.table.setItem(i, 1, QTableWidgetItem(volume.get("type")))
+                self.table.setItem(i, 2, QTableWidgetItem(volume.get("host")))
+                self.table.setItem(i, 3, QTableWidgetItem(volume.get("path_prefix")))
+                self.table.setItem(i, 4, QTableWidgetItem(volume.get("remote_path")))
+                self.table.item(i, 0).setData(Qt.ItemDataRole.UserRole, volume)
+        finally:
+            self.table.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
 
     def add_volume(self):
         """Open dialog to add a new volume."""
-        dialog = VolumeEditDialog(self)
+        dialog = self._edit_dialog_for()
         if dialog.exec():
             new_volume = dialog.get_volume_data()
-            volumes = self.settings.value("filesystem_volumes", [])
-            volumes.append(new_volume)
-            self.settings.setValue("filesystem_volumes", volumes)
+            self._volumes.append(new_volume)
+            self._save_volumes()
             self._save_password(new_volume['name'], dialog.get_password())
             self.load_volumes()
 
@@ -333,15 +446,22 @@ class VolumeManagerDialog(QDialog):
         
         volume_data = self.table.item(selected_row, 0).data(Qt.ItemDataRole.UserRole)
         
-        dialog = VolumeEditDialog(self, volume_data)
+        dialog = self._edit_dialog_for(volume_data)
         if dialog.exec():
             updated_volume = dialog.get_volume_data()
-            volumes = self.settings.value("filesystem_volumes", [])
-            volumes[selected_row] = updated_volume
-            self.settings.setValue("filesystem_volumes", volumes)
+            self._volumes[selected_row] = updated_volume
+            self._save_volumes()
             self._save_password(updated_volume['name'], dialog.get_password())
             self.load_volumes()
 
+    def _edit_dialog_for(self, volume_data: Optional[dict] = None) -> "VolumeEditDialog":
+        """The shared add/edit form, built once and reset for each use."""
+        if self._edit_dialog is None:
+            self._edit_dialog = VolumeEditDialog(self, volume_data)
+        else:
+            self._edit_dialog.load(volume_data)
+        return self._edit_dialog
+
     def remove_volume(self):
         """Remove the selected volume."""
         selected_row = self.table.currentRow()
@@ -355,12 +475,31 @@ class VolumeManagerDialog(QDialog):
             f"Are you sure you want to remove '{volume_name}'?")
             
         if reply == QMessageBox.StandardButton.Yes:
-            volumes = self.settings.value("filesystem_volumes", [])
-            volumes.pop(selected_row)
-            self.settings.setValue("filesystem_volumes", volumes)
+            self._volumes.pop(selected_row)
+            self._save_volumes()
             self._delete_password(volume_name)
             self.load_volumes()
 
+    def _read_volumes(self) -> list:
+        """Loads the saved volumes, moving them off the old nested-list key on first use."""
+        raw = self.settings.value(VOLUMES_KEY, "", type=str)
+        if raw:
+            try:
+                return json.loads(raw)
+            except ValueError as e:
+                logger.error(f"Saved volumes are not valid JSON, ignoring them: {e}")
+                return []
+
+        volumes = list(self.settings.value(LEGACY_VOLUMES_KEY, []) or [])
+        if volumes:
+            self.settings.setValue(VOLUMES_KEY, json.dumps(volumes))
+            self.settings.remove(LEGACY_VOLUMES_KEY)
+        return volumes
+
+    def _save_volumes(self):
+        """Write the working copy back to QSettings as one JSON string."""
+        self.settings.setValue(VOLUMES_KEY, json.dumps(self._volumes))
+
     def _get_keyring_key(self, volume_name):
         return f"volume_{volume_name}"
 
@@ -370,49 +509,46 @@ class VolumeManagerDialog(QDialog):
         if not self.secure_storage.is_available:
             QMessageBox.warning(self, "Keyring Error", "keyring library not found. Password not saved.")
             return
-        try:
-            self.secure_storage.set_credential(self._get_keyring_key(volume_name), password)
-        except Exception as e:
-            logger.error(f"Failed to store password: {e}")
-            QMessageBox.critical(self, "Keyring Error", f"Failed to store password:\n{e}")
+        runnable = ApiRunnable(self.secure_storage.set_credential, self._get_keyring_key(volume_name), password)
+        runnable.worker.finished.connect(self._on_password_saved)
+        self._keyring_pool.start(runnable)
+
+    def _on_password_saved(self, result, error: str):
+        if error:
+            logger.error(f"Failed to store password: {error}")
+            QMessageBox.critical(self, "Keyring Error", f"Failed to store password:\n{error}")
 
     def _delete_password(self, volume_name):
         if not self.secure_storage.is_available:
             return
-        try:
-            self.secure_storage.delete_credential(self._get_keyring_key(volume_name))
-        except Exception as e:
-            logger.error(f"Failed to delete password: {e}")
+        runnable = ApiRunnable(self.secure_storage.delete_credential, self._get_keyring_key(volume_name))
+        self._keyring_pool.start(runnable)
 
 
 class VolumeEditDialog(QDialog):
-    """Simple form to add/edit a volume's details."""
+    """Simple form to add/edit a volume's details; load() refills it so one instance can be reused."""
     def __init__(self, parent=None, volume_data=None):
         super().__init__(parent)
-        self.setWindowTitle("Edit Volume" if volume_data else "Add Volume")
         
         layout = QFormLayout(self)
         
-        self.name = QLineEdit(volume_data.get("name") if volume_data else "")
+        self.name = QLineEdit()
         self.type = QComboBox()
         self.type.addItems(["SMB", "SCP/SFTP"])
-        if volume_data:
-            self.type.setCurrentText(volume_data.get("type"))
             
-        self.host = QLineEdit(volume_data.get("host") if volume_data else "")
-        self.port = QLineEdit(volume_data.get("port") if volume_data else "")
+        self.host = QLineEdit()
+        self.port = QLineEdit()
         self.port.setPlaceholderText("e.g. 445 (SMB) or 22 (SFTP)")
         
-        self.path_prefix = QLineEdit(volume_data.get("path_prefix") if volume_data else "")
+        self.path_prefix = QLineEdit()
         self.path_prefix.setPlaceholderText("Path as Jellyfin sees it (e.g. /media/movies)")
         
-        self.remote_path = QLineEdit(volume_data.get("remote_path") if volume_data else "")
+        self.remote_path = QLineEdit()
         self.remote_path.setPlaceholderText("Remote path (e.g. /volume1/movies or 'share_name')")
         
-        self.username = QLineEdit(volume_data.get("username") if volume_data else "")
+        self.username = QLineEdit()
         self.password = QLineEdit()
         self.password.setEchoMode(QLineEdit.EchoMode.Password)
-        self.password.setPlaceholderText("Leave blank to keep unchanged" if volume_data else "")
 
         layout.addRow("Friendly Name (Unique):", self.name)
         layout.addRow("Type:", self.type)
@@ -423,10 +559,22 @@ class VolumeEditDialog(QDialog):
         layout.addRow("Username:", self.username)
         layout.addRow("Password:", self.password)
         
-        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
-        buttons.accepted.connect(self.accept)
-        buttons.rejected.connect(self.reject)
-        layout.addRow(buttons)
+        layout.addRow(_ok_cancel_buttons(self, self.accept))
+        self.load(volume_data)
+
+    def load(self, volume_data: Optional[dict] = None):
+        """Resets the form for a new volume, or fills it with an existing one's details."""
+        volume_data = volume_data or {}
+        self.setWindowTitle("Edit Volume" if volume_data else "Add Volume")
+        self.name.setText(volume_data.get("name", ""))
+        self.type.setCurrentText(volume_data.get("type") or "SMB")
+        self.host.setText(volume_data.get("host", ""))
+        self.port.setText(volume_data.get("port", ""))
+        self.path_prefix.setText(volume_data.get("path_prefix", ""))
+        self.remote_path.setText(volume_data.get("remote_path", ""))
+        self.username.setText(volume_data.get("username", ""))
+        self.password.clear()
+        self.password.setPlaceholderText("Leave blank to keep unchanged" if volume_data else "")
 
     def get_volume_data(self) -> dict:
         return {
@@ -440,4 +588,4 @@ class VolumeEditDialog(QDialog):
         }
     
     def get_password(self) -> str:
-        return self.password.text()
\ No newline at end of file
+        return self.password.text()
@@ -0,0 +1,24 @@
+# arr_omnitool/ui/widgets.py
+"""
+Shared UI widgets.
+"""
+
+from typing import Callable, Optional
+from PyQt6.QtWidgets import QWidget
+
+
+class LazyWidget(QWidget):
+    """
+    Empty container whose contents are built on first show.
+    Lets a plugin hand the main window a tab cheaply and defer the real
+    widget tree until the user actually opens it.
+    """
+    def __init__(self, builder: Callable[[QWidget], None], parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self._builder = builder
+
+    def showEvent(self, event):
+        if self._builder is not None:
+            builder, self._builder = self._builder, None
+            builder(self)
+        super().showEvent(event)